@@ -0,0 +1,71 @@
+"""Async event read endpoints (DB_BACKEND=async)."""
+from datetime import date
+from typing import List, Optional, Union
+from fastapi import APIRouter, Depends, status, Query, Request, Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from uuid import UUID
+from app.database import get_async_db
+from app.models import Event, EventType
+from app.schemas import EventResponse, Page
+from app.utils.errors import NotFoundError
+from app.utils.pagination import apply_keyset, finish_page, MAX_PAGE_SIZE
+from app.services.event_listing import EventListing, event_not_modified, page_response
+
+router = APIRouter(prefix="/api/events", tags=["Events"])
+
+
+@router.get("", response_model=Union[List[EventResponse], Page[EventResponse]], status_code=status.HTTP_200_OK)
+async def get_events(
+    request: Request,
+    type: Optional[EventType] = Query(None, description="Filter by event type"),
+    is_active: Optional[bool] = Query(None, description="Filter by active status"),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="Page size (enables cursor pagination)"),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page's next_cursor"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Get all events.
+    
+    Async counterpart of the sync endpoint with the same parameters,
+    caching and conditional request handling.
+    """
+    paginated = limit is not None or cursor is not None
+    listing = EventListing(request, type, is_active)
+    
+    if not paginated:
+        cached = listing.cached_response()
+        if cached is not None:
+            return cached
+    
+    stmt = select(Event).filter(*listing.filters)
+    
+    if paginated:
+        stmt, limit = apply_keyset(stmt, Event.date, Event.id, date, limit, cursor)
+        rows = (await db.execute(stmt)).scalars().all()
+        return page_response(*finish_page(rows, limit, Event.date, Event.id))
+    
+    not_modified = listing.not_modified((await db.execute(listing.validators_query())).one())
+    if not_modified is not None:
+        return not_modified
+    
+    return listing.response((await db.execute(stmt.order_by(Event.date.desc()))).scalars().all())
+
+
+@router.get("/{event_id}", response_model=EventResponse, status_code=status.HTTP_200_OK)
+async def get_event(
+    event_id: UUID,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Get a single event by ID."""
+    event = await db.get(Event, event_id)
+    
+    if not event:
+        raise NotFoundError("Event", str(event_id))
+    
+    not_modified = event_not_modified(request, response, event)
+    if not_modified is not None:
+        return not_modified
+    
+    return event
@@ -0,0 +1,89 @@
+"""Async public registration endpoint (DB_BACKEND=async)."""
+import asyncio
+from fastapi import APIRouter, Depends, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import get_async_db
+from app.models import Event, RegistrationStatus
+from app.schemas import RegistrationCreate, RegistrationResponse
+from app.utils.errors import NotFoundError, ConflictError
+from app.utils.validation import sanitize_string
+from app.services.registration_batcher import registration_batcher
+from app.services.registration_service import (
+    build_registration_claim,
+    build_registration_insert,
+    build_waitlist_claim,
+    event_response_with_count,
+    new_registration_values
+)
+from app.config import settings
+
+router = APIRouter(prefix="/api/registrations", tags=["Registrations"])
+
+
+@router.post("", response_model=RegistrationResponse, status_code=status.HTTP_201_CREATED)
+async def create_registration(
+    registration_data: RegistrationCreate,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Register for an event (Public).
+    
+    Async counterpart of the sync endpoint with the same contract.
+    """
+    # Sanitize inputs
+    operative_name = sanitize_string(registration_data.operative_name, max_length=100)
+    moodle_id = registration_data.moodle_id  # Already validated in schema
+    
+    if settings.registration_batching_enabled:
+        # Check if event exists and is active; the batcher maintains the counter
+        result = await db.execute(
+            select(Event).filter(
+                Event.id == registration_data.event_id,
+                Event.is_active == True
+            )
+        )
+        event = result.scalar_one_or_none()
+        
+        if not event:
+            raise NotFoundError("Event", str(registration_data.event_id))
+        
+        # Release the connection while the writer thread inserts the row
+        await db.close()
+        row, registration_count = await asyncio.wrap_future(
+            registration_batcher.submit(event.id, operative_name, moodle_id, event.title)
+        )
+        # The event was loaded before the insert; report the counter after it
+        return {**row, "event": event_response_with_count(event, registration_count)}
+    
+    # Take a seat with one atomic conditional UPDATE that also loads the
+    # event and doubles as the existence check; a full event waitlists
+    registration_status = RegistrationStatus.CONFIRMED
+    event = (await db.scalars(build_registration_claim(registration_data.event_id))).first()
+    
+    if not event:
+        registration_status = RegistrationStatus.WAITLISTED
+        event = (await db.scalars(build_waitlist_claim(registration_data.event_id))).first()
+    
+    if not event:
+        raise NotFoundError("Event", str(registration_data.event_id))
+    
+    # Rollback expires loaded objects, so keep the title for the error message
+    event_title = event.title
+    
+    # Single INSERT ... ON CONFLICT DO NOTHING RETURNING; no row means duplicate
+    result = await db.execute(
+        build_registration_insert([new_registration_values(event.id, operative_name, moodle_id, registration_status)])
+    )
+    row = result.mappings().one_or_none()
+    
+    if row is None:
+        # Rollback also releases the claimed seat
+        await db.rollback()
+        raise ConflictError(
+            f"Registration already exists for Moodle ID {moodle_id} and event {event_title}"
+        )
+    
+    await db.commit()
+    
+    # Reuse the already-loaded event for the nested field
+    return {**row, "event": event}
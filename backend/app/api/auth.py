@@ -7,7 +7,7 @@ from slowapi.util import get_remote_address
 from app.database import get_db
 from app.models import User
 from app.schemas import LoginRequest, Token, UserResponse
-from app.security import verify_password, create_access_token
+from app.security import verify_and_update_async, create_access_token
 from app.utils.errors import UnauthorizedError, create_error_response
 from app.dependencies import get_current_user
 from app.middleware.rate_limit import get_rate_limiter
@@ -31,11 +31,17 @@ async def login(
     
     Returns JWT access token on successful authentication.
     Rate limited to 5 attempts per 15 minutes per IP.
+    Returns 503 when too many logins are already being verified.
     """
     # Find user
     user = db.query(User).filter(User.username == login_data.username).first()
     
-    if not user or not verify_password(login_data.password, user.password_hash):
+    # Argon2 runs off the event loop; a saturated pool answers 503
+    verified, new_hash = False, None
+    if user:
+        verified, new_hash = await verify_and_update_async(login_data.password, user.password_hash)
+    
+    if not verified:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid username or password"
@@ -47,6 +53,10 @@ async def login(
             detail="User account is inactive"
         )
     
+    # Upgrade hashes made with older Argon2 parameters
+    if new_hash:
+        user.password_hash = new_hash
+    
     # Update last login
     user.last_login = datetime.utcnow()
     db.commit()
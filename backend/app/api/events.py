@@ -1,62 +1,126 @@
 """Event management endpoints."""
 from datetime import date
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from typing import List, Optional, Union
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
 from sqlalchemy.orm import Session
 from sqlalchemy import and_
 from uuid import UUID
 from app.database import get_db
 from app.models import Event, User, EventType
-from app.schemas import EventCreate, EventUpdate, EventResponse
+from app.schemas import EventCreate, EventUpdate, EventResponse, EventStats, Page
 from app.dependencies import get_current_user
 from app.utils.errors import NotFoundError, ValidationError
 from app.utils.validation import sanitize_string, sanitize_text
+from app.utils.pagination import paginate_keyset, MAX_PAGE_SIZE
+from app.services.cache_service import response_cache
+from app.services.event_listing import EventListing, event_not_modified, page_response
+from app.services.registration_service import promote_waitlist
 
 router = APIRouter(prefix="/api/events", tags=["Events"])
 
 
-@router.get("", response_model=List[EventResponse], status_code=status.HTTP_200_OK)
+@router.get("", response_model=Union[List[EventResponse], Page[EventResponse]], status_code=status.HTTP_200_OK)
 def get_events(
+    request: Request,
     type: Optional[EventType] = Query(None, description="Filter by event type"),
     is_active: Optional[bool] = Query(None, description="Filter by active status"),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="Page size (enables cursor pagination)"),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page's next_cursor"),
     db: Session = Depends(get_db)
 ):
     """Get all events.
     
     - **type**: Optional filter by event type
     - **is_active**: Optional filter by active status
+    - **limit**: Optional page size; returns `{items, next_cursor}` instead of a plain list
+    - **cursor**: Optional cursor to fetch the page after a previous one
     
     Returns list of events matching the filters.
+    Unpaginated listings are served from the response cache and carry an
+    ETag/Last-Modified; conditional requests that match get a 304. Only
+    event edits invalidate the cache, so registration counts in a cached
+    listing may lag by up to RESPONSE_CACHE_TTL_SECONDS.
     """
-    query = db.query(Event)
+    paginated = limit is not None or cursor is not None
+    listing = EventListing(request, type, is_active)
     
-    if type is not None:
-        query = query.filter(Event.type == type)
+    if not paginated:
+        cached = listing.cached_response()
+        if cached is not None:
+            return cached
     
-    if is_active is not None:
-        query = query.filter(Event.is_active == is_active)
+    query = db.query(Event).filter(*listing.filters)
     
-    events = query.order_by(Event.date.desc()).all()
-    return events
+    if paginated:
+        events, next_cursor = paginate_keyset(query, Event.date, Event.id, date, limit, cursor)
+        return page_response(events, next_cursor)
+    
+    not_modified = listing.not_modified(db.execute(listing.validators_query()).one())
+    if not_modified is not None:
+        return not_modified
+    
+    return listing.response(query.order_by(Event.date.desc()).all())
 
 
 @router.get("/{event_id}", response_model=EventResponse, status_code=status.HTTP_200_OK)
 def get_event(
     event_id: UUID,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db)
 ):
     """Get a single event by ID.
     
     - **event_id**: UUID of the event
+    
+    Carries an ETag/Last-Modified; conditional requests that match get a 304.
     """
     event = db.query(Event).filter(Event.id == event_id).first()
     
     if not event:
         raise NotFoundError("Event", str(event_id))
     
+    not_modified = event_not_modified(request, response, event)
+    if not_modified is not None:
+        return not_modified
+    
     return event
 
 
+@router.get("/{event_id}/stats", response_model=EventStats, status_code=status.HTTP_200_OK)
+def get_event_stats(
+    event_id: UUID,
+    db: Session = Depends(get_db)
+):
+    """Get registration statistics for an event.
+    
+    - **event_id**: UUID of the event
+    
+    Reads the maintained counter column instead of counting registrations.
+    """
+    stats = db.query(
+        Event.id,
+        Event.capacity,
+        Event.registration_count,
+        Event.waitlist_count,
+        Event.updated_at
+    ).filter(Event.id == event_id).first()
+    
+    if not stats:
+        raise NotFoundError("Event", str(event_id))
+    
+    return EventStats(
+        event_id=stats.id,
+        capacity=stats.capacity,
+        registration_count=stats.registration_count,
+        waitlist_count=stats.waitlist_count,
+        seats_available=(
+            max(stats.capacity - stats.registration_count, 0) if stats.capacity is not None else None
+        ),
+        updated_at=stats.updated_at
+    )
+
+
 @router.post("", response_model=EventResponse, status_code=status.HTTP_201_CREATED)
 def create_event(
     event_data: EventCreate,
@@ -69,6 +133,7 @@ def create_event(
     - **type**: Event type enum (required)
     - **date**: Event date (required)
     - **description**: Event description (optional)
+    - **capacity**: Maximum confirmed registrations (optional, unlimited if omitted)
     
     Requires admin authentication.
     """
@@ -86,12 +151,14 @@ def create_event(
         type=event_data.type,
         date=event_data.date,
         description=description,
+        capacity=event_data.capacity,
         is_active=True
     )
     
     db.add(event)
     db.commit()
     db.refresh(event)
+    response_cache.invalidate("events")
     
     return event
 
@@ -107,10 +174,17 @@ def update_event(
     
     - **event_id**: UUID of the event to update
     - All fields are optional in the request body
+    - **capacity**: Raising it (or sending null) promotes waitlisted registrations in order
     
     Requires admin authentication.
     """
-    event = db.query(Event).filter(Event.id == event_id).first()
+    capacity_changed = "capacity" in event_data.model_fields_set
+    
+    query = db.query(Event).filter(Event.id == event_id)
+    if capacity_changed:
+        # Serialize with concurrent seat claims while reallocating seats
+        query = query.with_for_update()
+    event = query.first()
     
     if not event:
         raise NotFoundError("Event", str(event_id))
@@ -133,8 +207,13 @@ def update_event(
     if event_data.is_active is not None:
         event.is_active = event_data.is_active
     
+    if capacity_changed:
+        event.capacity = event_data.capacity
+        promote_waitlist(db, event)
+    
     db.commit()
     db.refresh(event)
+    response_cache.invalidate("events")
     
     return event
 
@@ -160,5 +239,6 @@ def delete_event(
     # Soft delete
     event.is_active = False
     db.commit()
+    response_cache.invalidate("events")
     
     return None
@@ -1,17 +1,24 @@
 """Hackathon team registration endpoints."""
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from datetime import datetime
+from typing import List, Optional, Union
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
+from pydantic import TypeAdapter
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session, selectinload
 from sqlalchemy.exc import IntegrityError
 from uuid import UUID
 from app.database import get_db
 from app.models import HackathonTeam, TeamMember
-from app.schemas import HackathonTeamCreate, HackathonTeamResponse
+from app.schemas import HackathonTeamCreate, HackathonTeamResponse, HackathonTeamSummary, Page
 from app.utils.errors import ConflictError
 from app.utils.validation import sanitize_string
+from app.utils.pagination import paginate_keyset, MAX_PAGE_SIZE
 
 router = APIRouter(prefix="/api/hackathon-teams", tags=["Hackathon Teams"])
 
+team_list_adapter = TypeAdapter(List[HackathonTeamResponse])
+team_summary_list_adapter = TypeAdapter(List[HackathonTeamSummary])
+
 
 @router.post("", response_model=HackathonTeamResponse, status_code=status.HTTP_201_CREATED)
 def create_hackathon_team(
@@ -77,22 +84,78 @@ def create_hackathon_team(
     return team
 
 
-@router.get("", response_model=List[HackathonTeamResponse], status_code=status.HTTP_200_OK)
+@router.get(
+    "",
+    response_model=Union[
+        List[HackathonTeamResponse],
+        Page[HackathonTeamResponse],
+        List[HackathonTeamSummary],
+        Page[HackathonTeamSummary]
+    ],
+    status_code=status.HTTP_200_OK
+)
 def get_hackathon_teams(
     event_name: str = None,
+    include_members: bool = Query(True, description="Set to false to return member counts instead of members"),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="Page size (enables cursor pagination)"),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page's next_cursor"),
     db: Session = Depends(get_db)
 ):
     """Get all hackathon teams (Public for now).
     
     - **event_name**: Optional filter by event name
+    - **include_members**: Set to false to skip member details and return `member_count` per team
+    - **limit**: Optional page size; returns `{items, next_cursor}` instead of a plain list
+    - **cursor**: Optional cursor to fetch the page after a previous one
+    
+    Members are loaded with one extra IN query for the whole list rather
+    than one query per team.
     """
-    query = db.query(HackathonTeam)
+    paginated = limit is not None or cursor is not None
+    
+    if include_members:
+        query = db.query(HackathonTeam).options(selectinload(HackathonTeam.members))
+    else:
+        # Project team columns plus a correlated count; no member rows are loaded
+        member_count = (
+            select(func.count(TeamMember.id))
+            .where(TeamMember.team_id == HackathonTeam.id)
+            .correlate(HackathonTeam)
+            .scalar_subquery()
+            .label("member_count")
+        )
+        query = db.query(
+            HackathonTeam.id,
+            HackathonTeam.event_name,
+            HackathonTeam.team_name,
+            HackathonTeam.created_at,
+            member_count
+        )
     
     if event_name:
         query = query.filter(HackathonTeam.event_name == event_name)
     
-    teams = query.order_by(HackathonTeam.created_at.desc()).all()
-    return teams
+    if paginated:
+        teams, next_cursor = paginate_keyset(
+            query, HackathonTeam.created_at, HackathonTeam.id, datetime, limit, cursor
+        )
+    else:
+        teams, next_cursor = query.order_by(HackathonTeam.created_at.desc()).all(), None
+    
+    # Validate once and dump straight to JSON bytes, skipping response_model
+    # re-validation and jsonable_encoder (and, for summaries, so the response
+    # union cannot coerce them into full team responses)
+    item_model, list_adapter = (
+        (HackathonTeamResponse, team_list_adapter) if include_members
+        else (HackathonTeamSummary, team_summary_list_adapter)
+    )
+    items = list_adapter.validate_python(teams, from_attributes=True)
+    if paginated:
+        body = Page[item_model](items=items, next_cursor=next_cursor).model_dump_json()
+    else:
+        body = list_adapter.dump_json(items)
+    
+    return Response(content=body, media_type="application/json")
 
 
 @router.get("/{team_id}", response_model=HackathonTeamResponse, status_code=status.HTTP_200_OK)
@@ -104,7 +167,12 @@ def get_hackathon_team(
     
     - **team_id**: UUID of the team
     """
-    team = db.query(HackathonTeam).filter(HackathonTeam.id == team_id).first()
+    team = (
+        db.query(HackathonTeam)
+        .options(selectinload(HackathonTeam.members))
+        .filter(HackathonTeam.id == team_id)
+        .first()
+    )
     
     if not team:
         raise HTTPException(
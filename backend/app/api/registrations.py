@@ -1,19 +1,43 @@
 """Event registration endpoints."""
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
+from datetime import datetime
+from typing import List, Optional, Union
+import tempfile
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
+from starlette.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
-from sqlalchemy.exc import IntegrityError
 from uuid import UUID
 from app.database import get_db
-from app.models import Registration, User
-from app.schemas import RegistrationCreate, RegistrationResponse
+from app.models import Registration, RegistrationStatus, Event, User
+from app.schemas import RegistrationCreate, RegistrationResponse, Page, BulkImportReport
 from app.dependencies import get_current_user
-from app.utils.errors import NotFoundError, ConflictError
+from app.utils.errors import NotFoundError, ConflictError, ValidationError, PayloadTooLargeError
 from app.utils.validation import sanitize_string
-from app.services.export_service import export_registrations_to_csv
+from app.utils.pagination import paginate_keyset, MAX_PAGE_SIZE
+from app.services.export_service import iter_registrations_csv
+from app.services.registration_batcher import registration_batcher
+from app.services.registration_service import (
+    build_registration_claim,
+    build_registration_insert,
+    build_waitlist_claim,
+    event_response_with_count,
+    new_registration_values
+)
+from app.services.import_service import import_registrations, SUPPORTED_FORMATS
+from app.config import settings
 
 router = APIRouter(prefix="/api/registrations", tags=["Registrations"])
 
+registration_list_adapter = TypeAdapter(List[RegistrationResponse])
+
+# Import bodies stay in memory up to this size, then spill to a temp file
+IMPORT_SPOOL_MEMORY_BYTES = 1024 * 1024
+
+# Received bytes are handed to the spool in batches of this size, off the
+# event loop (a spilled spool writes to disk)
+IMPORT_SPOOL_WRITE_BYTES = 1024 * 1024
+
 
 @router.post("", response_model=RegistrationResponse, status_code=status.HTTP_201_CREATED)
 def create_registration(
@@ -27,49 +51,123 @@ def create_registration(
     - **moodle_id**: Moodle ID (8-12 alphanumeric characters)
     
     Prevents duplicate registrations for the same event by the same Moodle ID.
+    Once an event with a capacity is full, registrations are accepted with
+    status `waitlisted`.
     """
     # Sanitize inputs
     operative_name = sanitize_string(registration_data.operative_name, max_length=100)
     moodle_id = registration_data.moodle_id  # Already validated in schema
     
-    # Check if event exists and is active
-    from app.models import Event
-    event = db.query(Event).filter(
-        Event.id == registration_data.event_id,
-        Event.is_active == True
-    ).first()
+    if settings.registration_batching_enabled:
+        # Check if event exists and is active; the batcher maintains the counter
+        event = db.query(Event).filter(
+            Event.id == registration_data.event_id,
+            Event.is_active == True
+        ).first()
+        
+        if not event:
+            raise NotFoundError("Event", str(registration_data.event_id))
+        
+        # Return the connection to the pool before waiting on the writer
+        # thread, which needs one of its own; loaded attributes survive close
+        db.close()
+        row, registration_count = registration_batcher.submit(event.id, operative_name, moodle_id, event.title).result()
+        # The event was loaded before the insert; report the counter after it
+        return {**row, "event": event_response_with_count(event, registration_count)}
+    
+    # Take a seat with one atomic conditional UPDATE that also loads the
+    # event and doubles as the existence check; a full event waitlists
+    registration_status = RegistrationStatus.CONFIRMED
+    event = db.scalars(build_registration_claim(registration_data.event_id)).first()
+    
+    if not event:
+        registration_status = RegistrationStatus.WAITLISTED
+        event = db.scalars(build_waitlist_claim(registration_data.event_id)).first()
     
     if not event:
         raise NotFoundError("Event", str(registration_data.event_id))
     
-    # Create registration
-    registration = Registration(
-        event_id=registration_data.event_id,
-        operative_name=operative_name,
-        moodle_id=moodle_id
-    )
+    # Single INSERT ... ON CONFLICT DO NOTHING RETURNING; no row means duplicate
+    row = db.execute(
+        build_registration_insert([new_registration_values(event.id, operative_name, moodle_id, registration_status)])
+    ).mappings().one_or_none()
     
-    try:
-        db.add(registration)
-        db.commit()
-        db.refresh(registration)
-    except IntegrityError:
-        db.rollback()
-        raise ConflictError(
+    if row is None:
+        # Build the message first: rollback expires the loaded event
+        # (and releases the claimed seat)
+        conflict = ConflictError(
             f"Registration already exists for Moodle ID {moodle_id} and event {event.title}"
         )
+        db.rollback()
+        raise conflict
     
-    # Load event relationship
-    db.refresh(registration)
+    # Build the response from the returned row and the already-loaded event
+    # before commit expires it, so no refresh or lazy load is needed
+    registration = RegistrationResponse.model_validate({**row, "event": event}, from_attributes=True)
+    db.commit()
     
     return registration
 
 
-@router.get("", response_model=List[RegistrationResponse], status_code=status.HTTP_200_OK)
+@router.post("/bulk", response_model=BulkImportReport, status_code=status.HTTP_200_OK)
+async def bulk_import_registrations(
+    request: Request,
+    format: Optional[str] = Query(None, description="Upload format: csv or jsonl (defaults from Content-Type)"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Bulk import registrations from a CSV or JSONL request body (Admin only).
+    
+    - **format**: `csv` (header row with event_id, operative_name, moodle_id) or `jsonl`
+    
+    Each row is validated like `POST /api/registrations`. Returns a per-row
+    report marking rows as inserted, duplicate or invalid. Bodies over
+    BULK_IMPORT_MAX_MB are rejected with 413.
+    Requires admin authentication.
+    """
+    fmt = (format or "").lower()
+    if not fmt:
+        content_type = request.headers.get("content-type", "")
+        fmt = "jsonl" if "json" in content_type else "csv"
+    
+    if fmt not in SUPPORTED_FORMATS:
+        raise ValidationError(f"Unsupported import format '{fmt}'", {"supported": list(SUPPORTED_FORMATS)})
+    
+    max_bytes = settings.bulk_import_max_mb * 1024 * 1024
+    too_large = f"Import exceeds maximum allowed size of {settings.bulk_import_max_mb}MB"
+    
+    content_length = request.headers.get("content-length", "")
+    if content_length.isdigit() and int(content_length) > max_bytes:
+        raise PayloadTooLargeError(too_large)
+    
+    # Spool the streamed body (to disk past IMPORT_SPOOL_MEMORY_BYTES)
+    # instead of buffering it, counting bytes so an oversized or
+    # unannounced (chunked) body is cut off at the limit
+    with tempfile.SpooledTemporaryFile(max_size=IMPORT_SPOOL_MEMORY_BYTES) as spool:
+        received = 0
+        pending = bytearray()
+        async for chunk in request.stream():
+            received += len(chunk)
+            if received > max_bytes:
+                raise PayloadTooLargeError(too_large)
+            pending += chunk
+            if len(pending) >= IMPORT_SPOOL_WRITE_BYTES:
+                await run_in_threadpool(spool.write, bytes(pending))
+                pending.clear()
+        
+        await run_in_threadpool(spool.write, bytes(pending))
+        await run_in_threadpool(spool.seek, 0)
+        
+        return await run_in_threadpool(import_registrations, db, spool, fmt)
+
+
+@router.get("", response_model=Union[List[RegistrationResponse], Page[RegistrationResponse]], status_code=status.HTTP_200_OK)
 def get_registrations(
     event_id: Optional[UUID] = Query(None, description="Filter by event ID"),
     moodle_id: Optional[str] = Query(None, description="Filter by Moodle ID"),
     export: Optional[str] = Query(None, description="Export format (csv)"),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="Page size (enables cursor pagination)"),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page's next_cursor"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -77,7 +175,9 @@ def get_registrations(
     
     - **event_id**: Optional filter by event ID
     - **moodle_id**: Optional filter by Moodle ID
-    - **export**: Set to 'csv' to export as CSV file
+    - **export**: Set to 'csv' to export as CSV file (pagination is ignored)
+    - **limit**: Optional page size; returns `{items, next_cursor}` instead of a plain list
+    - **cursor**: Optional cursor to fetch the page after a previous one
     
     Requires admin authentication.
     """
@@ -89,18 +189,28 @@ def get_registrations(
     if moodle_id:
         query = query.filter(Registration.moodle_id == moodle_id)
     
-    registrations = query.order_by(Registration.timestamp.desc()).all()
-    
     # Handle CSV export
     if export and export.lower() == "csv":
-        csv_content = export_registrations_to_csv(db, event_id, registrations)
-        return Response(
-            content=csv_content,
+        return StreamingResponse(
+            iter_registrations_csv(db, event_id, moodle_id),
             media_type="text/csv",
             headers={"Content-Disposition": "attachment; filename=registrations.csv"}
         )
     
-    return registrations
+    # Validate once and dump straight to JSON bytes, skipping response_model
+    # re-validation and jsonable_encoder
+    if limit is not None or cursor is not None:
+        registrations, next_cursor = paginate_keyset(
+            query, Registration.timestamp, Registration.id, datetime, limit, cursor
+        )
+        body = Page[RegistrationResponse](items=registrations, next_cursor=next_cursor).model_dump_json()
+    else:
+        registrations = query.order_by(Registration.timestamp.desc()).all()
+        body = registration_list_adapter.dump_json(
+            registration_list_adapter.validate_python(registrations, from_attributes=True)
+        )
+    
+    return Response(content=body, media_type="application/json")
 
 
 @router.get("/{registration_id}", response_model=RegistrationResponse, status_code=status.HTTP_200_OK)
@@ -136,10 +246,8 @@ def export_registrations_csv(
     Returns CSV file download.
     Requires admin authentication.
     """
-    csv_content = export_registrations_to_csv(db, event_id)
-    
-    return Response(
-        content=csv_content,
+    return StreamingResponse(
+        iter_registrations_csv(db, event_id),
         media_type="text/csv",
         headers={"Content-Disposition": "attachment; filename=registrations.csv"}
     )
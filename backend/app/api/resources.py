@@ -1,8 +1,10 @@
 """PDF resource management endpoints."""
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query, UploadFile, File, Form
-from fastapi.responses import FileResponse, StreamingResponse
+from fastapi import APIRouter, Depends, HTTPException, status, Query, UploadFile, File, Form, Request, Response
+from fastapi.responses import RedirectResponse, StreamingResponse
 from sqlalchemy.orm import Session
+from sqlalchemy import func
+from pydantic import TypeAdapter
 from uuid import UUID
 from pathlib import Path
 import os
@@ -12,19 +14,28 @@ from app.schemas import ResourceCreate, ResourceUpdate, ResourceResponse
 from app.dependencies import get_current_user
 from app.utils.errors import NotFoundError
 from app.utils.validation import sanitize_string
+from app.utils.http_cache import make_etag, is_not_modified, not_modified_response, validator_headers
+from app.utils.http_range import ranged_response
 from app.services.file_service import (
     save_pdf_file,
-    delete_file,
-    file_exists,
+    release_file,
     validate_pdf_file
 )
+from app.services.storage import storage, storage_key
+from app.services.cache_service import response_cache
 from app.config import settings
 
 router = APIRouter(prefix="/api/resources", tags=["Resources"])
 
+resource_list_adapter = TypeAdapter(List[ResourceResponse])
+
+# Lifetime for downloads pinned to a file version with ?v=
+DOWNLOAD_MAX_AGE_SECONDS = 365 * 24 * 3600
+
 
 @router.get("", response_model=List[ResourceResponse], status_code=status.HTTP_200_OK)
 def get_resources(
+    request: Request,
     level: Optional[ResourceLevel] = Query(None, description="Filter by resource level"),
     db: Session = Depends(get_db)
 ):
@@ -33,60 +44,137 @@ def get_resources(
     - **level**: Optional filter by resource level (beginner, intermediate, advanced)
     
     Returns list of resources matching the filters.
+    Listings are served from the response cache and carry an
+    ETag/Last-Modified; conditional requests that match get a 304.
     """
-    query = db.query(Resource)
+    cache_key = response_cache.make_key("resources", level)
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        body, etag, last_modified = cached
+        if is_not_modified(request, etag, None):
+            return not_modified_response(etag, last_modified)
+        return Response(
+            content=body,
+            media_type="application/json",
+            headers=validator_headers(etag, last_modified)
+        )
+    
+    filters = []
     
     if level is not None:
-        query = query.filter(Resource.level == level)
+        filters.append(Resource.level == level)
+    
+    # Validate against an aggregate before loading any rows
+    row_count, last_modified = db.query(func.count(Resource.id), func.max(Resource.updated_at)).filter(*filters).one()
+    etag = make_etag("resources", level, row_count, last_modified)
     
-    resources = query.order_by(Resource.created_at.desc()).all()
-    return resources
+    # Deleting a resource does not move max(updated_at), so only the ETag
+    # (which also covers the row count) can tell whether the listing changed
+    if is_not_modified(request, etag, None):
+        return not_modified_response(etag, last_modified)
+    
+    resources = db.query(Resource).filter(*filters).order_by(Resource.created_at.desc()).all()
+    
+    # Serialize once and cache the JSON bytes with their validators
+    body = resource_list_adapter.dump_json(resource_list_adapter.validate_python(resources, from_attributes=True))
+    response_cache.set(cache_key, (body, etag, last_modified))
+    
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers=validator_headers(etag, last_modified)
+    )
 
 
 @router.get("/{resource_id}", response_model=ResourceResponse, status_code=status.HTTP_200_OK)
 def get_resource(
     resource_id: UUID,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db)
 ):
     """Get a single resource by ID.
     
     - **resource_id**: UUID of the resource
+    
+    Carries an ETag/Last-Modified; conditional requests that match get a 304.
     """
     resource = db.query(Resource).filter(Resource.id == resource_id).first()
     
     if not resource:
         raise NotFoundError("Resource", str(resource_id))
     
+    etag = make_etag("resource", resource.id, resource.updated_at)
+    
+    if is_not_modified(request, etag, resource.updated_at):
+        return not_modified_response(etag, resource.updated_at)
+    
+    response.headers.update(validator_headers(etag, resource.updated_at))
+    
     return resource
 
 
 @router.get("/{resource_id}/download", status_code=status.HTTP_200_OK)
 def download_resource(
     resource_id: UUID,
+    request: Request,
+    v: Optional[str] = Query(None, description="File version (the ETag value) for long-lived caching"),
     db: Session = Depends(get_db)
 ):
     """Download a PDF resource file.
     
     - **resource_id**: UUID of the resource
-    
-    Returns the PDF file for download.
+    - **v**: Optional file version; when it matches the current file the
+      response may be cached for a year
+    
+    With object storage and STORAGE_PRESIGNED_DOWNLOADS, redirects (307) to
+    a short-lived presigned URL so the file is served by the bucket.
+    Otherwise returns the PDF file for download, supporting
+    `Range`/`If-Range` (206 Partial Content, including multiple ranges)
+    for resuming, and `If-None-Match` (304).
     """
     resource = db.query(Resource).filter(Resource.id == resource_id).first()
     
     if not resource:
         raise NotFoundError("Resource", str(resource_id))
     
-    # Get full file path
-    file_path = Path(resource.file_url)
+    key = storage_key(resource.file_url)
+    filename = f"{resource.title.replace(' ', '_')}.pdf"
+    
+    if settings.storage_presigned_downloads:
+        url = storage.presign(key, filename, "application/pdf", settings.storage_presign_expires_seconds)
+        if url is not None:
+            # The URL expires, so the redirect itself must not be cached
+            return RedirectResponse(
+                url,
+                status_code=status.HTTP_307_TEMPORARY_REDIRECT,
+                headers={"Cache-Control": "no-store"}
+            )
     
-    if not file_exists(str(file_path)):
+    stored = storage.stat(key)
+    
+    if stored is None:
         raise NotFoundError("Resource file", str(resource_id))
     
-    # Return file for download
-    return FileResponse(
-        path=str(file_path),
-        filename=f"{resource.title.replace(' ', '_')}.pdf",
-        media_type="application/pdf"
+    # Stored files are immutable blobs named by GUID or content hash, so
+    # the blob name is a strong validator. The download URL itself is
+    # stable across file replacement, so only URLs pinned to the current
+    # blob are immutable.
+    version = Path(key).stem
+    if v == version:
+        cache_control = f"public, max-age={DOWNLOAD_MAX_AGE_SECONDS}, immutable"
+    else:
+        cache_control = "public, no-cache"
+    
+    return ranged_response(
+        request,
+        stored.size,
+        stored.last_modified,
+        lambda start, end: storage.get_stream(key, start, end),
+        filename=filename,
+        media_type="application/pdf",
+        etag=f'"{version}"',
+        headers={"Cache-Control": cache_control}
     )
 
 
@@ -102,7 +190,7 @@ def create_resource(
     
     - **title**: Resource title
     - **level**: Resource level (beginner, intermediate, advanced)
-    - **file**: PDF file to upload (max 10MB)
+    - **file**: PDF file to upload (max MAX_FILE_SIZE_MB, 10MB by default)
     
     Requires admin authentication.
     """
@@ -117,20 +205,22 @@ def create_resource(
     # Sanitize title
     sanitized_title = sanitize_string(title, max_length=200)
     
-    # Save file
-    file_url, file_size = save_pdf_file(file)
+    # Save file (an identical stored file is reused)
+    file_url, file_size, content_hash = save_pdf_file(file, db)
     
     # Create resource record
     resource = Resource(
         title=sanitized_title,
         level=level,
         file_url=file_url,
-        file_size=file_size
+        file_size=file_size,
+        content_hash=content_hash
     )
     
     db.add(resource)
     db.commit()
     db.refresh(resource)
+    response_cache.invalidate("resources")
     
     return resource
 
@@ -176,18 +266,20 @@ def update_resource(
                 detail=error_msg
             )
         
-        # Delete old file
-        old_file_path = Path(resource.file_url)
-        if old_file_path.exists():
-            delete_file(str(old_file_path))
-        
-        # Save new file
-        file_url, file_size = save_pdf_file(file)
+        # Save new file first; the old one is removed only after commit
+        old_file_url = resource.file_url
+        file_url, file_size, content_hash = save_pdf_file(file, db)
         resource.file_url = file_url
         resource.file_size = file_size
+        resource.content_hash = content_hash
     
     db.commit()
     db.refresh(resource)
+    response_cache.invalidate("resources")
+    
+    # Delete old file unless other resources still share it
+    if file is not None and old_file_url != resource.file_url:
+        release_file(db, old_file_url)
     
     return resource
 
@@ -202,7 +294,8 @@ def delete_resource(
     
     - **resource_id**: UUID of the resource to delete
     
-    Deletes both the database record and the file.
+    Deletes the database record, and the file once no other resource
+    shares it.
     Requires admin authentication.
     """
     resource = db.query(Resource).filter(Resource.id == resource_id).first()
@@ -210,13 +303,14 @@ def delete_resource(
     if not resource:
         raise NotFoundError("Resource", str(resource_id))
     
-    # Delete file
-    file_path = Path(resource.file_url)
-    if file_path.exists():
-        delete_file(str(file_path))
+    file_url = resource.file_url
     
     # Delete database record
     db.delete(resource)
     db.commit()
+    response_cache.invalidate("resources")
+    
+    # Delete file after the last reference is gone
+    release_file(db, file_url)
     
     return None
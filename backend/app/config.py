@@ -1,6 +1,6 @@
 """Application configuration from environment variables."""
-from pydantic_settings import BaseSettings
-from typing import List
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from typing import Dict, List, Tuple
 
 
 class Settings(BaseSettings):
@@ -10,16 +10,26 @@ class Settings(BaseSettings):
     database_url: str
     db_pool_size: int = 10
     db_max_overflow: int = 20
+    db_backend: str = "sync"  # "sync" (psycopg2) or "async" (asyncpg)
+    db_async_pool_share: float = 0.5  # share of the pool budget given to the async engine
     
     # Security
     jwt_secret_key: str
     jwt_algorithm: str = "HS256"
     jwt_expiration_seconds: int = 3600
     
+    # Auth caches (verified tokens and users, per process)
+    auth_cache_enabled: bool = True
+    auth_token_cache_max_entries: int = 1024
+    auth_user_cache_max_entries: int = 256
+    auth_user_cache_ttl_seconds: int = 30
+    
     # Argon2
     argon2_time_cost: int = 2
     argon2_memory_cost: int = 65536
     argon2_parallelism: int = 4
+    argon2_max_workers: int = 2  # concurrent hashes per process
+    argon2_max_queue: int = 8  # waiting hashes before logins get 503
     
     # CORS
     frontend_url: str = "http://localhost:5500"
@@ -28,28 +38,104 @@ class Settings(BaseSettings):
     # File Upload
     upload_dir: str = "./uploads"
     max_file_size_mb: int = 10
+    # Store uploads by SHA-256 so identical files are kept once
+    content_addressed_storage: bool = False
+    
+    # File Storage
+    storage_backend: str = "local"  # "local" (UPLOAD_DIR) or "s3"
+    s3_bucket: str = ""
+    s3_key_prefix: str = ""
+    s3_endpoint_url: str = ""  # empty for AWS, e.g. http://minio:9000 otherwise
+    s3_public_endpoint_url: str = ""  # host in presigned URLs, if browsers reach it differently
+    s3_region: str = "us-east-1"
+    s3_access_key_id: str = ""
+    s3_secret_access_key: str = ""
+    s3_multipart_part_size_mb: int = 8
+    storage_presigned_downloads: bool = True  # redirect downloads to the bucket
+    storage_presign_expires_seconds: int = 300
     
     # Server
     host: str = "0.0.0.0"
     port: int = 8000
     debug: bool = False
     
+    # Security Headers (empty string omits the header)
+    security_hsts: str = "max-age=31536000; includeSubDomains"
+    security_frame_options: str = "DENY"
+    security_referrer_policy: str = "strict-origin-when-cross-origin"
+    # CSP allowing CDN resources for frontend (Google Fonts, Font Awesome, GSAP, Three.js)
+    security_csp: str = (
+        "default-src 'self'; "
+        "script-src 'self' 'unsafe-inline' https://cdnjs.cloudflare.com; "
+        "style-src 'self' 'unsafe-inline' https://fonts.googleapis.com https://cdnjs.cloudflare.com; "
+        "font-src 'self' https://fonts.gstatic.com https://cdnjs.cloudflare.com; "
+        "connect-src 'self' http://localhost:8000 http://127.0.0.1:8000"
+    )
+    
     # Rate Limiting
     rate_limit_enabled: bool = True
+    rate_limit_storage_uri: str = "memory://"  # memory://, sqlite:///path.db or redis://host:6379
+    rate_limit_strategy: str = "sliding-window-counter"
+    # Token buckets on public writes, per client IP:
+    # "METHOD /path=<requests per minute>:<burst>", comma-separated
+    route_rate_limits: str = "POST /api/registrations=30:10,POST /api/hackathon-teams=6:3"
+    route_rate_limit_max_clients: int = 10000
+    
+    # Registration write batching
+    registration_batching_enabled: bool = False
+    registration_batch_window_ms: int = 5
+    registration_batch_max_size: int = 500
+    
+    # Bulk registration import
+    bulk_import_max_mb: int = 20
+    
+    # Response Cache (public event/resource listings)
+    response_cache_enabled: bool = True
+    response_cache_ttl_seconds: int = 60
+    response_cache_max_entries: int = 256
     
     @property
     def allowed_origins_list(self) -> List[str]:
         """Parse comma-separated allowed origins into a list."""
         return [origin.strip() for origin in self.allowed_origins.split(",")]
     
+    @property
+    def route_rate_limits_map(self) -> Dict[Tuple[str, str], Tuple[float, int]]:
+        """Parse route_rate_limits into (method, path) -> (tokens per second, burst).
+        
+        Raises:
+            ValueError: If a rate or burst is not positive (a bucket that
+                never refills cannot compute a Retry-After)
+        """
+        budgets = {}
+        for entry in self.route_rate_limits.split(","):
+            if not entry.strip():
+                continue
+            route, _, budget = entry.partition("=")
+            method, path = route.split()
+            per_minute, _, burst = budget.partition(":")
+            rate, capacity = float(per_minute) / 60, int(burst or per_minute)
+            if rate <= 0 or capacity <= 0:
+                raise ValueError(
+                    f"ROUTE_RATE_LIMITS entry {entry.strip()!r}: requests per minute and burst must be positive"
+                )
+            budgets[(method.upper(), path.rstrip("/") or "/")] = (rate, capacity)
+        return budgets
+    
+    @property
+    def async_database_url(self) -> str:
+        """Database URL rewritten for the asyncpg driver."""
+        scheme, _, rest = self.database_url.partition("://")
+        if scheme.split("+")[0] in ("postgresql", "postgres"):
+            return f"postgresql+asyncpg://{rest}"
+        return self.database_url
+    
     @property
     def max_file_size_bytes(self) -> int:
         """Convert MB to bytes."""
         return self.max_file_size_mb * 1024 * 1024
     
-    class Config:
-        env_file = ".env"
-        case_sensitive = False
+    model_config = SettingsConfigDict(env_file=".env", case_sensitive=False)
 
 
 settings = Settings()
@@ -1,14 +1,37 @@
 """Database connection and session management."""
+from typing import Tuple
 from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from app.config import settings
 
+
+def _split_pool_budget(size: int, share: float) -> Tuple[int, int]:
+    """Split a connection count into (sync, async) parts.
+    
+    Each engine needs at least one connection, so a budget of one is
+    given to both.
+    """
+    if size <= 1:
+        return size, size
+    async_part = min(max(round(size * share), 1), size - 1)
+    return size - async_part, async_part
+
+
+# DB_POOL_SIZE and DB_MAX_OVERFLOW are the per-process connection budget.
+# With the async backend both engines are live, so they share it instead
+# of each opening a full pool.
+if settings.db_backend == "async":
+    sync_pool_size, async_pool_size = _split_pool_budget(settings.db_pool_size, settings.db_async_pool_share)
+    sync_max_overflow, async_max_overflow = _split_pool_budget(settings.db_max_overflow, settings.db_async_pool_share)
+else:
+    sync_pool_size, sync_max_overflow = settings.db_pool_size, settings.db_max_overflow
+
 # Create database engine
 engine = create_engine(
     settings.database_url,
-    pool_size=settings.db_pool_size,
-    max_overflow=settings.db_max_overflow,
+    pool_size=sync_pool_size,
+    max_overflow=sync_max_overflow,
     pool_pre_ping=True,  # Verify connections before using
     echo=settings.debug
 )
@@ -16,6 +39,25 @@ engine = create_engine(
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async engine and session factory, only built when the async backend is selected
+async_engine = None
+AsyncSessionLocal = None
+
+if settings.db_backend == "async":
+    from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+    async_engine = create_async_engine(
+        settings.async_database_url,
+        pool_size=async_pool_size,
+        max_overflow=async_max_overflow,
+        pool_pre_ping=True,
+        echo=settings.debug
+    )
+
+    # expire_on_commit=False: attributes stay loaded after commit, since
+    # lazy refreshes are not possible outside the async context
+    AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
 # Base class for models
 Base = declarative_base()
 
@@ -27,3 +69,9 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    """Dependency for getting an async database session."""
+    async with AsyncSessionLocal() as db:
+        yield db
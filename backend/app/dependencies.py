@@ -3,8 +3,8 @@ from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
 from app.database import get_db
-from app.security import decode_access_token
 from app.models import User
+from app.services.auth_cache import get_token_claims, get_active_user
 
 security = HTTPBearer()
 
@@ -13,9 +13,13 @@ def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: Session = Depends(get_db)
 ) -> User:
-    """Dependency to get the current authenticated user."""
+    """Dependency to get the current authenticated user.
+    
+    Verified tokens and users are cached, so a repeat request normally
+    needs neither a signature check nor a database query.
+    """
     token = credentials.credentials
-    payload = decode_access_token(token)
+    payload = get_token_claims(token)
     
     if payload is None:
         raise HTTPException(
@@ -32,8 +36,8 @@ def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    user = db.query(User).filter(User.username == username).first()
-    if user is None or not user.is_active:
+    user = get_active_user(db, username)
+    if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User not found or inactive",
@@ -1,6 +1,6 @@
 """FastAPI application entry point."""
 from fastapi import FastAPI, Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from fastapi.security import HTTPBearer
 from starlette.exceptions import HTTPException as StarletteHTTPException
@@ -10,9 +10,15 @@ from app.database import engine, Base
 from app.middleware.cors import setup_cors
 from app.middleware.security_headers import SecurityHeadersMiddleware
 from app.middleware.rate_limit import get_rate_limiter, get_rate_limit_exceeded_handler
+from app.middleware.token_bucket import TokenBucketMiddleware, token_bucket_limiter
+from app.middleware.body_limit import BodySizeLimitMiddleware, MULTIPART_OVERHEAD_BYTES
 from app.api import auth, events, registrations, resources, hackathon_teams
 from app.dependencies import get_current_user
 from app.utils.errors import create_error_response, AppException
+from app.utils.validation import validation_error_message
+from app.services.cache_service import response_cache
+from app.services.registration_batcher import registration_batcher
+from app.services.file_service import upload_timings
 
 # Security scheme for OpenAPI
 security_scheme = HTTPBearer()
@@ -44,6 +50,8 @@ app = FastAPI(
     * Security headers (HSTS, CSP, X-Frame-Options)
     """,
     version="1.0.0",
+    # orjson renders responses several times faster than the stdlib encoder
+    default_response_class=ORJSONResponse,
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_url="/openapi.json",
@@ -125,15 +133,33 @@ limiter = get_rate_limiter()
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, get_rate_limit_exceeded_handler())
 
-# Add middleware
+# Add middleware (last added runs first; 429s still get security and CORS headers)
+app.add_middleware(
+    BodySizeLimitMiddleware,
+    routes=[("POST", "/api/resources"), ("PUT", "/api/resources/")],
+    max_bytes=settings.max_file_size_bytes + MULTIPART_OVERHEAD_BYTES
+)
+app.add_middleware(TokenBucketMiddleware, limiter=token_bucket_limiter)
 app.add_middleware(SecurityHeadersMiddleware)
 setup_cors(app)
 
+@app.on_event("shutdown")
+def stop_registration_batcher():
+    """Flush queued registrations before the worker exits."""
+    registration_batcher.stop()
+
 # Create database tables (in production, use Alembic migrations)
 if settings.debug:
     Base.metadata.create_all(bind=engine)
 
 # Include routers
+if settings.db_backend == "async":
+    # Registered first so they take precedence over the sync routes
+    # with the same method and path; everything else stays sync
+    from app.api.aio import events as async_events, registrations as async_registrations
+    app.include_router(async_events.router, include_in_schema=False)
+    app.include_router(async_registrations.router, include_in_schema=False)
+
 app.include_router(auth.router)
 app.include_router(events.router)
 app.include_router(registrations.router)
@@ -151,7 +177,8 @@ async def app_exception_handler(request: Request, exc: AppException):
             exc.error_code,
             exc.detail,
             exc.details
-        ).dict()
+        ).model_dump(),
+        headers=exc.headers
     )
 
 
@@ -177,7 +204,7 @@ async def http_exception_handler(request: Request, exc: StarletteHTTPException):
             error_code,
             exc.detail or "An error occurred",
             {}
-        ).dict()
+        ).model_dump()
     )
 
 
@@ -187,7 +214,7 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
     errors = {}
     for error in exc.errors():
         field = ".".join(str(loc) for loc in error["loc"] if loc != "body")
-        errors[field] = error["msg"]
+        errors[field] = validation_error_message(error)
     
     return JSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
@@ -196,7 +223,7 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
             "VALIDATION_ERROR",
             "Validation error",
             {"fields": errors}
-        ).dict()
+        ).model_dump()
     )
 
 
@@ -215,3 +242,21 @@ def root():
 def health_check():
     """Health check endpoint."""
     return {"status": "healthy"}
+
+
+@app.get("/health/cache", tags=["Health"])
+def cache_stats():
+    """Response cache hit/miss counters."""
+    return response_cache.stats()
+
+
+@app.get("/health/rate-limits", tags=["Health"])
+def rate_limit_stats():
+    """Requests rejected by the per-route token buckets."""
+    return token_bucket_limiter.stats()
+
+
+@app.get("/health/uploads", tags=["Health"])
+def upload_stats():
+    """Upload validation and storage timings."""
+    return upload_timings.stats()
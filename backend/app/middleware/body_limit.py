@@ -0,0 +1,66 @@
+"""Request body size limit for upload endpoints."""
+from typing import Iterable, Tuple
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.config import settings
+from app.utils.errors import PayloadTooLargeError, create_error_response
+
+# Room for multipart boundaries and the non-file form fields
+MULTIPART_OVERHEAD_BYTES = 64 * 1024
+
+
+class BodySizeLimitMiddleware:
+    """Abort uploads as soon as the body exceeds the allowed size.
+    
+    Multipart forms are fully received and spooled before the endpoint
+    runs, so a size check in the endpoint only happens after the whole
+    upload has arrived. This middleware rejects a too-large Content-Length
+    up front and counts bytes as they are received otherwise, raising 413
+    from inside body parsing the moment the limit is crossed.
+    """
+    
+    def __init__(self, app: ASGIApp, routes: Iterable[Tuple[str, str]], max_bytes: int):
+        self.app = app
+        self.routes = tuple(routes)  # (method, path prefix)
+        self.max_bytes = max_bytes
+    
+    def _applies(self, scope: Scope) -> bool:
+        return any(
+            scope["method"] == method and scope["path"].startswith(prefix)
+            for method, prefix in self.routes
+        )
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self._applies(scope):
+            await self.app(scope, receive, send)
+            return
+        
+        max_bytes = self.max_bytes
+        message = f"Upload exceeds maximum allowed size of {settings.max_file_size_mb}MB"
+        
+        for name, value in scope["headers"]:
+            if name == b"content-length" and value.isdigit() and int(value) > max_bytes:
+                await self._reject(scope, receive, send, message)
+                return
+        
+        received = 0
+        
+        async def limited_receive() -> Message:
+            nonlocal received
+            incoming = await receive()
+            if incoming["type"] == "http.request":
+                received += len(incoming.get("body", b""))
+                if received > max_bytes:
+                    # Raised inside request.form(); FastAPI re-raises
+                    # HTTPExceptions and the app handler renders the 413
+                    raise PayloadTooLargeError(message)
+            return incoming
+        
+        await self.app(scope, limited_receive, send)
+    
+    async def _reject(self, scope: Scope, receive: Receive, send: Send, message: str) -> None:
+        response = JSONResponse(
+            status_code=413,
+            content=create_error_response(413, "PAYLOAD_TOO_LARGE", message).model_dump()
+        )
+        await response(scope, receive, send)
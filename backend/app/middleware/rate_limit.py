@@ -4,9 +4,18 @@ from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
 from fastapi import Request
 from app.config import settings
+# Registers the sqlite:// storage scheme with limits
+from app.middleware import rate_limit_storage  # noqa: F401
 
-# Initialize rate limiter
-limiter = Limiter(key_func=get_remote_address)
+# Initialize rate limiter. Counters live in RATE_LIMIT_STORAGE_URI:
+# memory:// is per process, so with several workers use sqlite:// (one
+# host) or redis:// (several hosts) to enforce limits across all of them.
+limiter = Limiter(
+    key_func=get_remote_address,
+    enabled=settings.rate_limit_enabled,
+    storage_uri=settings.rate_limit_storage_uri,
+    strategy=settings.rate_limit_strategy
+)
 
 
 def get_rate_limiter():
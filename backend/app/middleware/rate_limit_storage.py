@@ -0,0 +1,162 @@
+"""SQLite-backed rate limit storage shared by all workers on one host."""
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from math import floor
+from typing import Iterator, Optional, Tuple
+from limits.storage import Storage, SlidingWindowCounterSupport
+from limits.storage.base import TimestampedSlidingWindow
+
+# Expired counters are swept at most this often (seconds)
+PURGE_INTERVAL_SECONDS = 60
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS rate_limit_counters (
+    key TEXT PRIMARY KEY,
+    count INTEGER NOT NULL,
+    expires_at REAL NOT NULL
+) WITHOUT ROWID
+"""
+
+# Increment a live counter, or restart an expired or missing one
+INCR_SQL = """
+INSERT INTO rate_limit_counters (key, count, expires_at) VALUES (:key, :amount, :expires_at)
+ON CONFLICT (key) DO UPDATE SET
+    count = CASE WHEN expires_at <= :now THEN excluded.count ELSE count + excluded.count END,
+    expires_at = CASE WHEN expires_at <= :now THEN excluded.expires_at ELSE expires_at END
+RETURNING count
+"""
+
+
+class SQLiteStorage(Storage, SlidingWindowCounterSupport, TimestampedSlidingWindow):
+    """Rate limit counters in a local SQLite file.
+
+    Registered with `limits` under the ``sqlite`` scheme, using the same
+    path convention as SQLAlchemy: ``sqlite:///relative.db`` or
+    ``sqlite:////absolute/path.db``. Every uvicorn worker opens the same
+    file, so limits hold across processes on one host without extra
+    infrastructure. The database runs in WAL mode and each sliding-window
+    acquire is a single ``BEGIN IMMEDIATE`` transaction, so the
+    check-and-increment is atomic across processes.
+
+    Each key keeps at most two rows (previous and current window), which
+    expire on their own and are swept periodically.
+    """
+
+    STORAGE_SCHEME = ["sqlite"]
+
+    def __init__(self, uri: str, wrap_exceptions: bool = False, timeout: float = 5.0, **options):
+        super().__init__(uri, wrap_exceptions=wrap_exceptions, **options)
+        self.path = uri.split("://", 1)[1][1:] or ":memory:"
+        self.timeout = timeout
+        self._local = threading.local()
+        self._next_purge = 0.0
+        with self._transaction() as conn:
+            conn.execute(SCHEMA)
+
+    @property
+    def base_exceptions(self):
+        return sqlite3.Error
+
+    @property
+    def _conn(self) -> sqlite3.Connection:
+        """Per-thread connection (sqlite3 connections are not thread-safe)."""
+        conn: Optional[sqlite3.Connection] = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Write transaction that takes the database lock up front."""
+        conn = self._conn
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def _incr(self, conn: sqlite3.Connection, key: str, expiry: float, amount: int, now: float) -> int:
+        return conn.execute(
+            INCR_SQL, {"key": key, "amount": amount, "expires_at": now + expiry, "now": now}
+        ).fetchone()[0]
+
+    def _get(self, conn: sqlite3.Connection, key: str, now: float) -> Tuple[int, float]:
+        row = conn.execute(
+            "SELECT count, expires_at FROM rate_limit_counters WHERE key = ? AND expires_at > ?",
+            (key, now)
+        ).fetchone()
+        return row if row else (0, now)
+
+    def _maybe_purge(self, conn: sqlite3.Connection, now: float) -> None:
+        if now >= self._next_purge:
+            self._next_purge = now + PURGE_INTERVAL_SECONDS
+            conn.execute("DELETE FROM rate_limit_counters WHERE expires_at <= ?", (now,))
+
+    def incr(self, key: str, expiry: int, amount: int = 1) -> int:
+        now = time.time()
+        with self._transaction() as conn:
+            self._maybe_purge(conn, now)
+            return self._incr(conn, key, expiry, amount, now)
+
+    def get(self, key: str) -> int:
+        return self._get(self._conn, key, time.time())[0]
+
+    def get_expiry(self, key: str) -> float:
+        return self._get(self._conn, key, time.time())[1]
+
+    def check(self) -> bool:
+        try:
+            self._conn.execute("SELECT 1")
+            return True
+        except sqlite3.Error:
+            return False
+
+    def reset(self) -> Optional[int]:
+        with self._transaction() as conn:
+            return conn.execute("DELETE FROM rate_limit_counters").rowcount
+
+    def clear(self, key: str) -> None:
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM rate_limit_counters WHERE key = ?", (key,))
+
+    def _sliding_window(self, conn: sqlite3.Connection, key: str, expiry: int, now: float):
+        previous_key, current_key = self.sliding_window_keys(key, expiry, now)
+        previous_count = self._get(conn, previous_key, now)[0]
+        current_count = self._get(conn, current_key, now)[0]
+        previous_ttl = (1 - (((now - expiry) / expiry) % 1)) * expiry if previous_count else 0.0
+        current_ttl = (1 - ((now / expiry) % 1)) * expiry + expiry
+        return current_key, previous_count, previous_ttl, current_count, current_ttl
+
+    def acquire_sliding_window_entry(self, key: str, limit: int, expiry: int, amount: int = 1) -> bool:
+        if amount > limit:
+            return False
+        now = time.time()
+        with self._transaction() as conn:
+            self._maybe_purge(conn, now)
+            current_key, previous_count, previous_ttl, current_count, _ = self._sliding_window(
+                conn, key, expiry, now
+            )
+            weighted_count = previous_count * previous_ttl / expiry + current_count
+            if floor(weighted_count) + amount > limit:
+                return False
+            # The current window's counter becomes the previous one next
+            # window, so it lives for two window lengths
+            self._incr(conn, current_key, 2 * expiry, amount, now)
+            return True
+
+    def get_sliding_window(self, key: str, expiry: int) -> Tuple[int, float, int, float]:
+        return self._sliding_window(self._conn, key, expiry, time.time())[1:]
+
+    def clear_sliding_window(self, key: str, expiry: int) -> None:
+        previous_key, current_key = self.sliding_window_keys(key, expiry, time.time())
+        with self._transaction() as conn:
+            conn.execute(
+                "DELETE FROM rate_limit_counters WHERE key IN (?, ?)", (previous_key, current_key)
+            )
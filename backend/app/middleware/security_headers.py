@@ -1,29 +1,51 @@
 """Security headers middleware."""
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from typing import Dict, Optional
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from app.config import settings
 
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
-    """Middleware to add security headers to all responses."""
+def default_security_headers() -> Dict[str, str]:
+    """Security headers built from settings; empty values are omitted."""
+    headers = {
+        "X-Content-Type-Options": "nosniff",
+        "X-Frame-Options": settings.security_frame_options,
+        "X-XSS-Protection": "1; mode=block",
+        "Strict-Transport-Security": settings.security_hsts,
+        "Content-Security-Policy": settings.security_csp,
+        "Referrer-Policy": settings.security_referrer_policy,
+    }
+    return {name: value for name, value in headers.items() if value}
+
+
+class SecurityHeadersMiddleware:
+    """Pure ASGI middleware to add security headers to all responses.
     
-    async def dispatch(self, request: Request, call_next):
-        response: Response = await call_next(request)
-        
-        # Security headers
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-Frame-Options"] = "DENY"
-        response.headers["X-XSS-Protection"] = "1; mode=block"
-        response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
+    The header block is encoded once at startup and spliced into each
+    `http.response.start` message, replacing any same-named headers set by
+    the route. Unlike BaseHTTPMiddleware this adds no extra task or stream
+    per request, so streaming responses keep their backpressure.
+    """
+    
+    def __init__(self, app: ASGIApp, headers: Optional[Dict[str, str]] = None):
+        self.app = app
+        headers = default_security_headers() if headers is None else headers
+        self.raw_headers = [
+            (name.lower().encode("latin-1"), value.encode("latin-1"))
+            for name, value in headers.items()
+        ]
+        self.header_names = frozenset(name for name, _ in self.raw_headers)
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
         
-        # CSP allowing CDN resources for frontend (Google Fonts, Font Awesome, GSAP, Three.js)
-        response.headers["Content-Security-Policy"] = (
-            "default-src 'self'; "
-            "script-src 'self' 'unsafe-inline' https://cdnjs.cloudflare.com; "
-            "style-src 'self' 'unsafe-inline' https://fonts.googleapis.com https://cdnjs.cloudflare.com; "
-            "font-src 'self' https://fonts.gstatic.com https://cdnjs.cloudflare.com; "
-            "connect-src 'self' http://localhost:8000 http://127.0.0.1:8000"
-        )
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [
+                    header for header in message.get("headers", ())
+                    if header[0].lower() not in self.header_names
+                ] + self.raw_headers
+            await send(message)
         
-        return response
+        await self.app(scope, receive, send_with_headers)
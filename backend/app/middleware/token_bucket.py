@@ -0,0 +1,109 @@
+"""Per-route token bucket limits for public write endpoints."""
+import math
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+from app.config import settings
+from app.utils.errors import create_error_response
+
+# (method, path) -> (tokens added per second, bucket capacity)
+RouteBudgets = Dict[Tuple[str, str], Tuple[float, int]]
+
+
+class TokenBucketLimiter:
+    """Token buckets keyed by route and client.
+
+    Each (route, client) pair gets a bucket of `burst` tokens refilled at a
+    steady rate; a request spends one token or is rejected. Buckets are
+    kept in an LRU bounded by `max_clients`, so a flood of distinct client
+    addresses cannot grow memory without bound.
+    """
+
+    def __init__(self, budgets: RouteBudgets, max_clients: int = 10000):
+        self.budgets = budgets
+        self.max_clients = max_clients
+        # key -> (tokens, last refill time)
+        self._buckets: "OrderedDict[Tuple[str, str, str], Tuple[float, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.rejected: Dict[str, int] = {f"{method} {path}": 0 for method, path in budgets}
+
+    def acquire(self, method: str, path: str, client: str) -> Optional[float]:
+        """Spend one token for this request.
+
+        Returns:
+            None if allowed (or the route has no budget), otherwise the
+            seconds until a token is available
+        """
+        budget = self.budgets.get((method, path))
+        if budget is None:
+            return None
+        rate, burst = budget
+        key = (method, path, client)
+        now = time.monotonic()
+
+        with self._lock:
+            tokens, updated = self._buckets.pop(key, (burst, now))
+            tokens = min(burst, tokens + (now - updated) * rate)
+
+            if tokens >= 1:
+                self._buckets[key] = (tokens - 1, now)
+                retry_after = None
+            else:
+                self._buckets[key] = (tokens, now)
+                self.rejected[f"{method} {path}"] += 1
+                retry_after = (1 - tokens) / rate
+
+            while len(self._buckets) > self.max_clients:
+                self._buckets.popitem(last=False)
+
+        return retry_after
+
+    def stats(self) -> Dict[str, object]:
+        """Rejection counters per route and number of tracked buckets."""
+        with self._lock:
+            return {"rejected": dict(self.rejected), "buckets": len(self._buckets)}
+
+
+class TokenBucketMiddleware:
+    """Reject over-budget requests before routing.
+
+    Runs ahead of dependency resolution, so a flood on a limited route is
+    answered with 429 without opening a database session. Buckets are
+    per worker process; this is a cheap first line of defence in front of
+    the shared limits on individual endpoints.
+    """
+
+    def __init__(self, app: ASGIApp, limiter: "TokenBucketLimiter"):
+        self.app = app
+        self.limiter = limiter
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            path = scope["path"].rstrip("/") or "/"
+            client = scope["client"][0] if scope.get("client") else "unknown"
+            retry_after = self.limiter.acquire(scope["method"], path, client)
+
+            if retry_after is not None:
+                response = JSONResponse(
+                    status_code=429,
+                    content=create_error_response(
+                        429,
+                        "TOO_MANY_REQUESTS",
+                        "Rate limit exceeded, try again later",
+                        {"retry_after": math.ceil(retry_after)}
+                    ).model_dump(),
+                    headers={"Retry-After": str(math.ceil(retry_after))}
+                )
+                await response(scope, receive, send)
+                return
+
+        await self.app(scope, receive, send)
+
+
+token_bucket_limiter = TokenBucketLimiter(
+    settings.route_rate_limits_map if settings.rate_limit_enabled else {},
+    max_clients=settings.route_rate_limit_max_clients
+)
@@ -1,7 +1,7 @@
 """SQLAlchemy database models."""
 import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, Boolean, DateTime, Date, Text, Integer, ForeignKey, Enum as SQLEnum, UniqueConstraint
+from sqlalchemy import Column, String, Boolean, DateTime, Date, Text, Integer, ForeignKey, Enum as SQLEnum, UniqueConstraint, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 import enum
@@ -17,6 +17,12 @@ class EventType(str, enum.Enum):
     LECTURE = "Lecture"
 
 
+class RegistrationStatus(str, enum.Enum):
+    """Registration status enumeration."""
+    CONFIRMED = "confirmed"
+    WAITLISTED = "waitlisted"
+
+
 class ResourceLevel(str, enum.Enum):
     """Resource level enumeration."""
     BEGINNER = "beginner"
@@ -49,12 +55,20 @@ class Event(Base):
     date = Column(Date, nullable=False)
     description = Column(Text, nullable=True)
     is_active = Column(Boolean, default=True, nullable=False)
+    capacity = Column(Integer, nullable=True)  # None = unlimited seats
+    registration_count = Column(Integer, default=0, server_default="0", nullable=False)  # Confirmed seats, maintained on insert
+    waitlist_count = Column(Integer, default=0, server_default="0", nullable=False)  # Maintained on insert
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
     
     # Relationships
     registrations = relationship("Registration", back_populates="event", cascade="all, delete-orphan")
     
+    # Keyset pagination index on the (date, id) sort key
+    __table_args__ = (
+        Index('ix_events_date_id', 'date', 'id'),
+    )
+    
     def __repr__(self):
         return f"<Event(title={self.title}, type={self.type})>"
 
@@ -67,14 +81,18 @@ class Registration(Base):
     event_id = Column(UUID(as_uuid=True), ForeignKey("events.id"), nullable=False)
     operative_name = Column(String(100), nullable=False)
     moodle_id = Column(String(20), nullable=False, index=True)
+    status = Column(SQLEnum(RegistrationStatus), default=RegistrationStatus.CONFIRMED, server_default="CONFIRMED", nullable=False)
     timestamp = Column(DateTime, default=datetime.utcnow, nullable=False)
     
     # Relationships
     event = relationship("Event", back_populates="registrations")
     
-    # Unique constraint to prevent duplicate registrations
+    # Unique constraint to prevent duplicate registrations,
+    # plus keyset pagination indexes on the (timestamp, id) sort key
     __table_args__ = (
         UniqueConstraint('event_id', 'moodle_id', name='unique_event_moodle'),
+        Index('ix_registrations_timestamp_id', 'timestamp', 'id'),
+        Index('ix_registrations_event_timestamp_id', 'event_id', 'timestamp', 'id'),
     )
     
     def __repr__(self):
@@ -88,8 +106,10 @@ class Resource(Base):
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     title = Column(String(200), nullable=False)
     level = Column(SQLEnum(ResourceLevel), nullable=False)
-    file_url = Column(String(500), nullable=False, unique=True)
+    # Not unique: with content-addressed storage, identical uploads share a file
+    file_url = Column(String(500), nullable=False, index=True)
     file_size = Column(Integer, nullable=True)  # Size in bytes
+    content_hash = Column(String(64), nullable=True, index=True)  # SHA-256 hex digest
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
     
@@ -109,9 +129,11 @@ class HackathonTeam(Base):
     # Relationships
     members = relationship("TeamMember", back_populates="team", cascade="all, delete-orphan")
     
-    # Unique constraint for team name per event
+    # Unique constraint for team name per event,
+    # plus keyset pagination index on the (created_at, id) sort key
     __table_args__ = (
         UniqueConstraint('event_name', 'team_name', name='unique_event_team_name'),
+        Index('ix_hackathon_teams_created_at_id', 'created_at', 'id'),
     )
     
     def __repr__(self):
@@ -123,7 +145,7 @@ class TeamMember(Base):
     __tablename__ = "team_members"
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    team_id = Column(UUID(as_uuid=True), ForeignKey("hackathon_teams.id", ondelete="CASCADE"), nullable=False)
+    team_id = Column(UUID(as_uuid=True), ForeignKey("hackathon_teams.id", ondelete="CASCADE"), nullable=False, index=True)
     name = Column(String(100), nullable=False)
     email = Column(String(100), nullable=False, index=True)
     moodle_id = Column(String(20), nullable=False, index=True)
@@ -1,9 +1,22 @@
 """Pydantic schemas for request/response validation."""
-from pydantic import BaseModel, EmailStr, Field, validator
-from typing import Optional, List
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, StringConstraints, field_validator
+from typing import Annotated, Dict, Optional, List, Generic, TypeVar
 from datetime import date, datetime
 from uuid import UUID
-from app.models import EventType, ResourceLevel
+from app.models import EventType, ResourceLevel, RegistrationStatus
+
+# Format constraints, enforced inside pydantic-core
+MOODLE_ID_PATTERN = r'^[a-zA-Z0-9]{8,12}$'
+MOBILE_PATTERN = r'^[0-9]{10}$'
+
+MoodleId = Annotated[str, StringConstraints(pattern=MOODLE_ID_PATTERN)]
+MobileNumber = Annotated[str, StringConstraints(pattern=MOBILE_PATTERN)]
+
+# User-facing wording for pattern mismatches (see validation_error_message)
+PATTERN_MESSAGES: Dict[str, str] = {
+    MOODLE_ID_PATTERN: 'Moodle ID must be 8-12 alphanumeric characters',
+    MOBILE_PATTERN: 'Mobile number must be exactly 10 digits',
+}
 
 
 # Authentication Schemas
@@ -27,8 +40,7 @@ class UserResponse(BaseModel):
     last_login: Optional[datetime] = None
     created_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Event Schemas
@@ -38,6 +50,7 @@ class EventBase(BaseModel):
     type: EventType
     date: date
     description: Optional[str] = None
+    capacity: Optional[int] = Field(None, ge=1)
 
 
 class EventCreate(EventBase):
@@ -51,6 +64,7 @@ class EventUpdate(BaseModel):
     type: Optional[EventType] = None
     date: Optional[date] = None
     description: Optional[str] = None
+    capacity: Optional[int] = Field(None, ge=1)  # Send null to remove the limit
     is_active: Optional[bool] = None
 
 
@@ -58,11 +72,21 @@ class EventResponse(EventBase):
     """Event response schema."""
     id: UUID
     is_active: bool
+    registration_count: int = 0
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+
+class EventStats(BaseModel):
+    """Event registration statistics."""
+    event_id: UUID
+    capacity: Optional[int] = None
+    registration_count: int
+    waitlist_count: int
+    seats_available: Optional[int] = None
+    updated_at: datetime
 
 
 # Registration Schemas
@@ -70,15 +94,7 @@ class RegistrationCreate(BaseModel):
     """Registration creation schema."""
     event_id: UUID
     operative_name: str = Field(..., min_length=1, max_length=100)
-    moodle_id: str = Field(..., min_length=1, max_length=20)
-    
-    @validator('moodle_id')
-    def validate_moodle_id(cls, v):
-        """Validate Moodle ID format (alphanumeric, 8-12 chars)."""
-        import re
-        if not re.match(r'^[a-zA-Z0-9]{8,12}$', v):
-            raise ValueError('Moodle ID must be 8-12 alphanumeric characters')
-        return v
+    moodle_id: MoodleId
 
 
 class RegistrationResponse(BaseModel):
@@ -87,11 +103,30 @@ class RegistrationResponse(BaseModel):
     event_id: UUID
     operative_name: str
     moodle_id: str
+    status: RegistrationStatus = RegistrationStatus.CONFIRMED
     timestamp: datetime
     event: Optional[EventResponse] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+
+class BulkImportRowResult(BaseModel):
+    """Outcome of one row in a bulk registration import."""
+    row: int
+    status: str  # inserted, duplicate or invalid
+    moodle_id: Optional[str] = None
+    id: Optional[UUID] = None
+    registration_status: Optional[RegistrationStatus] = None
+    error: Optional[str] = None
+
+
+class BulkImportReport(BaseModel):
+    """Bulk registration import report."""
+    total: int
+    inserted: int
+    duplicate: int
+    invalid: int
+    rows: List[BulkImportRowResult]
 
 
 # Resource Schemas
@@ -120,8 +155,17 @@ class ResourceResponse(ResourceBase):
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+
+# Pagination Schemas
+T = TypeVar("T")
+
+
+class Page(BaseModel, Generic[T]):
+    """Keyset-paginated list response."""
+    items: List[T]
+    next_cursor: Optional[str] = None
 
 
 # Error Schemas
@@ -147,31 +191,21 @@ class TeamMemberBase(BaseModel):
     division: str = Field(..., min_length=1, max_length=5)
     department: str = Field(..., min_length=1, max_length=100)
     year: str = Field(..., min_length=1, max_length=10)
-    mobile: str = Field(..., pattern=r'^[0-9]{10}$')
+    mobile: MobileNumber
     is_leader: bool = False
-    
-    @validator('mobile')
-    def validate_mobile(cls, v):
-        """Validate mobile number is exactly 10 digits."""
-        if not v.isdigit() or len(v) != 10:
-            raise ValueError('Mobile number must be exactly 10 digits')
-        return v
 
 
 class HackathonTeamCreate(BaseModel):
     """Schema for creating a hackathon team."""
     event_name: str = Field(..., min_length=1, max_length=200)
     team_name: str = Field(..., min_length=1, max_length=100)
-    team_members: List[TeamMemberBase] = Field(..., min_items=4, max_items=4)
+    team_members: List[TeamMemberBase] = Field(..., min_length=4, max_length=4)
     
-    @validator('team_members')
-    def validate_team_members(cls, v):
-        """Validate exactly 4 members and exactly 1 team leader."""
-        if len(v) != 4:
-            raise ValueError('Team must have exactly 4 members')
-        
-        leaders = [m for m in v if m.is_leader]
-        if len(leaders) != 1:
+    @field_validator('team_members')
+    @classmethod
+    def validate_team_members(cls, v: List[TeamMemberBase]) -> List[TeamMemberBase]:
+        """Validate exactly 1 team leader (the member count is a length constraint)."""
+        if sum(1 for m in v if m.is_leader) != 1:
             raise ValueError('Team must have exactly 1 leader')
         
         return v
@@ -191,8 +225,7 @@ class TeamMemberResponse(BaseModel):
     is_leader: bool
     created_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class HackathonTeamResponse(BaseModel):
@@ -203,5 +236,15 @@ class HackathonTeamResponse(BaseModel):
     created_at: datetime
     members: List[TeamMemberResponse] = []
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+
+class HackathonTeamSummary(BaseModel):
+    """Hackathon team without member details (include_members=false)."""
+    id: UUID
+    event_name: str
+    team_name: str
+    created_at: datetime
+    member_count: int
+    
+    model_config = ConfigDict(from_attributes=True)
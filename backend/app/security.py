@@ -1,10 +1,16 @@
 """Security utilities for authentication and password hashing."""
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Callable, Optional, Tuple, TypeVar
 from jose import JWTError, jwt
 from argon2 import PasswordHasher
 from argon2.exceptions import VerifyMismatchError
 from app.config import settings
+from app.utils.errors import ServiceUnavailableError
+
+T = TypeVar("T")
 
 # Initialize Argon2 password hasher
 ph = PasswordHasher(
@@ -28,6 +34,55 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
         return False
 
 
+def verify_and_update(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """Verify a password and rehash it if its parameters are outdated.
+    
+    Returns:
+        (verified, new_hash); new_hash is set only when the stored hash was
+        created with different Argon2 parameters than the current settings
+    """
+    if not verify_password(plain_password, hashed_password):
+        return False, None
+    if ph.check_needs_rehash(hashed_password):
+        return True, hash_password(plain_password)
+    return True, None
+
+
+# Argon2 work runs here instead of on the event loop. argon2-cffi releases
+# the GIL while hashing, so threads give real parallelism; the pool size
+# bounds CPU use and peak memory (memory_cost KiB per concurrent hash).
+_hash_executor = ThreadPoolExecutor(
+    max_workers=settings.argon2_max_workers,
+    thread_name_prefix="argon2"
+)
+# Running plus queued hashes; beyond this, requests are shed with 503
+_hash_slots = threading.BoundedSemaphore(settings.argon2_max_workers + settings.argon2_max_queue)
+
+
+async def _run_hash_job(func: Callable[..., T], *args) -> T:
+    """Run an Argon2 call in the hashing pool, or fail fast when it is full."""
+    if not _hash_slots.acquire(blocking=False):
+        raise ServiceUnavailableError("Authentication service is busy, try again shortly")
+    try:
+        job = _hash_executor.submit(func, *args)
+    except BaseException:
+        _hash_slots.release()
+        raise
+    # Free the slot when the job itself finishes, not when the awaiting
+    # request does: a cancelled request leaves its hash queued or running
+    job.add_done_callback(lambda _: _hash_slots.release())
+    return await asyncio.wrap_future(job)
+
+
+async def verify_and_update_async(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """verify_and_update in the bounded hashing pool, as a single job.
+    
+    Raises:
+        ServiceUnavailableError: If the pool and its queue are full
+    """
+    return await _run_hash_job(verify_and_update, plain_password, hashed_password)
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Create a JWT access token."""
     to_encode = data.copy()
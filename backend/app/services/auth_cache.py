@@ -0,0 +1,95 @@
+"""Caches for verified access tokens and authenticated users."""
+import time
+from itertools import chain
+from typing import Optional
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+from app.config import settings
+from app.models import User
+from app.security import decode_access_token
+from app.services.cache_service import ResponseCache
+
+# Verified token -> claims, each entry expiring with the token's exp claim
+token_cache = ResponseCache(
+    max_entries=settings.auth_token_cache_max_entries,
+    ttl_seconds=settings.jwt_expiration_seconds,
+    enabled=settings.auth_cache_enabled
+)
+
+# Username -> detached User, one namespace per user so it can be dropped alone
+user_cache = ResponseCache(
+    max_entries=settings.auth_user_cache_max_entries,
+    ttl_seconds=settings.auth_user_cache_ttl_seconds,
+    enabled=settings.auth_cache_enabled
+)
+
+
+def get_token_claims(token: str) -> Optional[dict]:
+    """Decode and verify a JWT, reusing the claims of tokens seen before.
+
+    Returns:
+        The token's claims, or None if it is invalid or expired
+    """
+    key = token_cache.make_key("token", token)
+    cached = token_cache.get(key)
+    if cached is not None:
+        return cached
+
+    payload = decode_access_token(token)
+    if payload is not None and "exp" in payload:
+        ttl = payload["exp"] - time.time()
+        if ttl > 0:
+            token_cache.set(key, payload, ttl_seconds=ttl)
+    return payload
+
+
+def get_active_user(db: Session, username: str) -> Optional[User]:
+    """Load an active user by username, served from the user cache when fresh.
+
+    Cached users are expunged from the session that loaded them, so commits
+    elsewhere never expire them; treat them as read-only.
+    """
+    namespace = f"user:{username}"
+    key = user_cache.make_key(namespace)
+    user = user_cache.get(key)
+    if user is not None:
+        return user
+
+    user = db.query(User).filter(User.username == username).first()
+    if user is None or not user.is_active:
+        return None
+
+    db.expunge(user)
+    user_cache.set(key, user)
+    return user
+
+
+def invalidate_user(username: str) -> None:
+    """Drop a user's cached entry (e.g. after deactivation or a password change)."""
+    user_cache.invalidate(f"user:{username}")
+
+
+# Session.info key collecting usernames written in the current transaction
+_CHANGED_USERS = "auth_cache.changed_users"
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_changed_users(session: Session, flush_context) -> None:
+    """Remember users written by this flush, including under their old username.
+
+    They are only invalidated once the transaction commits: dropping the
+    entry earlier would let a concurrent request re-cache the row as it was
+    before the change.
+    """
+    changed = session.info.setdefault(_CHANGED_USERS, set())
+    for target in chain(session.dirty, session.deleted):
+        if isinstance(target, User):
+            changed.add(target.username)
+            changed.update(inspect(target).attrs.username.history.deleted)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_users(session: Session) -> None:
+    """Invalidate the users whose changes were just committed."""
+    for username in session.info.pop(_CHANGED_USERS, ()):
+        invalidate_user(username)
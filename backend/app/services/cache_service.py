@@ -0,0 +1,112 @@
+"""In-process response cache for public listings."""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+from app.config import settings
+
+
+class ResponseCache:
+    """Size-bounded LRU cache of serialized responses with TTL and versioning.
+
+    Entries are grouped by namespace (e.g. "events"). Each namespace has a
+    version number that is part of every key; invalidating a namespace bumps
+    the version, so entries computed before a write can never be served
+    after it, even if they are stored late by a concurrent request.
+
+    The cache is per-process: with several workers, a write invalidates only
+    the worker that handled it and the TTL bounds staleness elsewhere.
+    """
+
+    def __init__(self, max_entries: int = 256, ttl_seconds: float = 60.0, enabled: bool = True):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.enabled = enabled
+        self._entries: "OrderedDict[Tuple, Tuple[float, Any]]" = OrderedDict()
+        self._versions: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def make_key(self, namespace: str, *params: Hashable) -> Tuple:
+        """Build a cache key for the current version of a namespace."""
+        with self._lock:
+            return (namespace, self._versions.get(namespace, 0), params)
+
+    def get(self, key: Tuple) -> Optional[Any]:
+        """Return the cached value for a key, or None on miss or expiry."""
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: Tuple, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        """Store a serialized response, evicting least recently used entries.
+
+        `ttl_seconds` overrides the cache-wide TTL for this entry.
+        """
+        if not self.enabled:
+            return
+        if ttl_seconds is None:
+            ttl_seconds = self.ttl_seconds
+
+        with self._lock:
+            # Drop results computed against a namespace version that is gone
+            if key[1] != self._versions.get(key[0], 0):
+                return
+
+            self._entries[key] = (time.monotonic() + ttl_seconds, value)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, namespace: str) -> None:
+        """Invalidate every entry in a namespace."""
+        with self._lock:
+            self._versions[namespace] = self._versions.get(namespace, 0) + 1
+            for key in [k for k in self._entries if k[0] == namespace]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Remove all entries and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and current size."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+# Shared cache for public event and resource listings
+response_cache = ResponseCache(
+    max_entries=settings.response_cache_max_entries,
+    ttl_seconds=settings.response_cache_ttl_seconds,
+    enabled=settings.response_cache_enabled
+)
@@ -0,0 +1,93 @@
+"""Event read logic shared by the sync and async endpoints.
+
+The endpoints only differ in how they execute the statements built here.
+"""
+from datetime import datetime
+from typing import List, Optional, Sequence
+from fastapi import Request, Response
+from pydantic import TypeAdapter
+from sqlalchemy import Select, func, select
+from app.models import Event, EventType
+from app.schemas import EventResponse, Page
+from app.services.cache_service import response_cache
+from app.utils.http_cache import make_etag, is_not_modified, not_modified_response, validator_headers
+
+event_list_adapter = TypeAdapter(List[EventResponse])
+
+
+def _json_response(body: bytes, etag: str, last_modified: Optional[datetime]) -> Response:
+    return Response(content=body, media_type="application/json", headers=validator_headers(etag, last_modified))
+
+
+class EventListing:
+    """An unpaginated event listing: filters, cache entry and validators.
+
+    Registration counts change without touching updated_at, so only the
+    ETag (which covers them) can tell whether a listing changed; requests
+    are matched on the ETag alone. Only event edits invalidate the cache,
+    so counts in a cached listing may lag by up to the cache TTL.
+    """
+
+    def __init__(self, request: Request, type: Optional[EventType], is_active: Optional[bool]):
+        self.request = request
+        self.type = type
+        self.is_active = is_active
+        self.cache_key = response_cache.make_key("events", type, is_active)
+        self.filters = []
+        if type is not None:
+            self.filters.append(Event.type == type)
+        if is_active is not None:
+            self.filters.append(Event.is_active == is_active)
+        self.etag: Optional[str] = None
+        self.last_modified: Optional[datetime] = None
+
+    def cached_response(self) -> Optional[Response]:
+        """The cached listing (or a 304 for it), or None on a cache miss."""
+        cached = response_cache.get(self.cache_key)
+        if cached is None:
+            return None
+        body, etag, last_modified = cached
+        if is_not_modified(self.request, etag, None):
+            return not_modified_response(etag, last_modified)
+        return _json_response(body, etag, last_modified)
+
+    def validators_query(self) -> Select:
+        """Aggregate to validate against before loading any rows."""
+        return select(
+            func.count(Event.id), func.max(Event.updated_at), func.sum(Event.registration_count)
+        ).filter(*self.filters)
+
+    def not_modified(self, aggregate: Sequence) -> Optional[Response]:
+        """Take the validators from the aggregate row; a 304 if the client's copy is current."""
+        row_count, self.last_modified, registrations = aggregate
+        self.etag = make_etag("events", self.type, self.is_active, row_count, self.last_modified, registrations)
+        if is_not_modified(self.request, self.etag, None):
+            return not_modified_response(self.etag, self.last_modified)
+        return None
+
+    def response(self, events: Sequence[Event]) -> Response:
+        """Serialize the events once and cache the JSON bytes with their validators."""
+        body = event_list_adapter.dump_json(event_list_adapter.validate_python(events, from_attributes=True))
+        response_cache.set(self.cache_key, (body, self.etag, self.last_modified))
+        return _json_response(body, self.etag, self.last_modified)
+
+
+def page_response(events: Sequence[Event], next_cursor: Optional[str]) -> Response:
+    """A page of events, serialized like the unpaginated listing."""
+    return Response(
+        content=Page[EventResponse](items=events, next_cursor=next_cursor).model_dump_json(),
+        media_type="application/json"
+    )
+
+
+def event_not_modified(request: Request, response: Response, event: Event) -> Optional[Response]:
+    """A 304 if the client's copy of the event is current, else set its validators on `response`.
+
+    The ETag covers the registration count, which Last-Modified does not,
+    so requests are matched on the ETag alone.
+    """
+    etag = make_etag("event", event.id, event.updated_at, event.registration_count)
+    if is_not_modified(request, etag, None):
+        return not_modified_response(etag, event.updated_at)
+    response.headers.update(validator_headers(etag, event.updated_at))
+    return None
@@ -1,60 +1,85 @@
 """CSV export service for registrations."""
 import csv
 import io
-from typing import List, Optional
+from typing import Iterator, Optional
 from sqlalchemy.orm import Session
 from app.models import Registration, Event
 from uuid import UUID
 
+# Rows fetched per server-side cursor round trip and written per yielded chunk
+EXPORT_BATCH_SIZE = 1000
 
-def export_registrations_to_csv(
+CSV_HEADER = [
+    "Registration ID",
+    "Event Title",
+    "Event Type",
+    "Event Date",
+    "Operative Name",
+    "Moodle ID",
+    "Status",
+    "Registration Timestamp"
+]
+
+
+def iter_registrations_csv(
     db: Session,
     event_id: Optional[UUID] = None,
-    registrations: Optional[List[Registration]] = None
-) -> str:
-    """Export registrations to CSV format.
-    
+    moodle_id: Optional[str] = None
+) -> Iterator[str]:
+    """Stream registrations as CSV chunks.
+
+    Runs a single query joined with events and streams it through a
+    server-side cursor, so memory stays constant regardless of row count.
+
     Args:
-        db: Database session
+        db: Database session (must stay open while the iterator is consumed)
         event_id: Optional event ID to filter by
-        registrations: Optional pre-fetched registrations list
-    
-    Returns:
-        CSV content as string
+        moodle_id: Optional Moodle ID to filter by
+
+    Yields:
+        CSV content in chunks of up to EXPORT_BATCH_SIZE rows
     """
-    # Get registrations if not provided
-    if registrations is None:
-        query = db.query(Registration)
-        if event_id:
-            query = query.filter(Registration.event_id == event_id)
-        registrations = query.order_by(Registration.timestamp.desc()).all()
-    
-    # Create CSV in memory
-    output = io.StringIO()
-    writer = csv.writer(output)
-    
-    # Write header
-    writer.writerow([
-        "Registration ID",
-        "Event Title",
-        "Event Type",
-        "Event Date",
-        "Operative Name",
-        "Moodle ID",
-        "Registration Timestamp"
-    ])
-    
-    # Write data rows
-    for reg in registrations:
-        event = reg.event if reg.event else db.query(Event).filter(Event.id == reg.event_id).first()
+    query = db.query(
+        Registration.id,
+        Event.title,
+        Event.type,
+        Event.date,
+        Registration.operative_name,
+        Registration.moodle_id,
+        Registration.status,
+        Registration.timestamp
+    ).outerjoin(Event, Registration.event_id == Event.id)
+
+    if event_id:
+        query = query.filter(Registration.event_id == event_id)
+
+    if moodle_id:
+        query = query.filter(Registration.moodle_id == moodle_id)
+
+    query = query.order_by(Registration.timestamp.desc()).yield_per(EXPORT_BATCH_SIZE)
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(CSV_HEADER)
+
+    rows_in_buffer = 0
+    for reg_id, title, event_type, event_date, operative_name, reg_moodle_id, reg_status, timestamp in query:
         writer.writerow([
-            str(reg.id),
-            event.title if event else "N/A",
-            event.type.value if event else "N/A",
-            event.date.isoformat() if event else "N/A",
-            reg.operative_name,
-            reg.moodle_id,
-            reg.timestamp.isoformat()
+            str(reg_id),
+            title if title is not None else "N/A",
+            event_type.value if event_type is not None else "N/A",
+            event_date.isoformat() if event_date is not None else "N/A",
+            operative_name,
+            reg_moodle_id,
+            reg_status.value,
+            timestamp.isoformat()
         ])
-    
-    return output.getvalue()
+        rows_in_buffer += 1
+
+        if rows_in_buffer >= EXPORT_BATCH_SIZE:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate(0)
+            rows_in_buffer = 0
+
+    yield buffer.getvalue()
@@ -1,10 +1,76 @@
 """File upload and download service for PDF resources."""
+import hashlib
+import logging
+import re
+import threading
+import time
 import uuid
-import os
-from pathlib import Path
-from typing import Optional, Tuple
+from typing import BinaryIO, Dict, Iterator, Optional, Tuple
 from fastapi import UploadFile, HTTPException, status
+from sqlalchemy import text
+from sqlalchemy.orm import Session
 from app.config import settings
+from app.models import Resource
+from app.services.storage import storage, storage_key
+
+logger = logging.getLogger(__name__)
+
+# Bytes read per chunk when streaming an upload to storage
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Leading bytes passed to libmagic; PDF detection only needs the header
+MAGIC_SNIFF_BYTES = 2048
+
+# The spec puts the trailer in the last 1024 bytes (PDF 1.7, annex H), but
+# files with junk appended after %%EOF are common and viewers open them,
+# so a wider tail is searched
+PDF_TAIL_BYTES = 64 * 1024
+
+# "startxref <offset> %%EOF" closing the last (possibly incremental) update
+STARTXREF_PATTERN = re.compile(rb"startxref\s+(\d+)\s+%%EOF")
+
+# A cross-reference in the tail: a classic "xref" table (not the "xref" in
+# "startxref") or its "trailer", or an xref stream's /Type /XRef
+XREF_MARKER_PATTERN = re.compile(rb"(?<!start)xref\b|\btrailer\b|/XRef\b")
+
+# At startxref: a classic xref table, or an xref stream object ("12 0 obj")
+XREF_PATTERN = re.compile(rb"\s*(xref|\d+\s+\d+\s+obj)")
+
+_magic_lock = threading.Lock()
+_magic_detector = None
+_magic_loaded = False
+
+
+class UploadTimings:
+    """Durations of the upload validation and storage phases.
+    
+    Counters are per process, like the response cache statistics.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._phases: Dict[str, Tuple[int, float, float]] = {}  # count, total, max
+    
+    def record(self, phase: str, seconds: float) -> None:
+        """Add one measurement for a phase."""
+        with self._lock:
+            count, total, peak = self._phases.get(phase, (0, 0.0, 0.0))
+            self._phases[phase] = (count + 1, total + seconds, max(peak, seconds))
+    
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Count, mean and max milliseconds per phase."""
+        with self._lock:
+            return {
+                phase: {
+                    "count": count,
+                    "avg_ms": round(total / count * 1000, 3),
+                    "max_ms": round(peak * 1000, 3),
+                }
+                for phase, (count, total, peak) in self._phases.items()
+            }
+
+
+upload_timings = UploadTimings()
 
 
 def validate_pdf_file(file: UploadFile) -> Tuple[bool, Optional[str]]:
@@ -24,8 +90,43 @@ def validate_pdf_file(file: UploadFile) -> Tuple[bool, Optional[str]]:
     return True, None
 
 
+def _load_magic_detector():
+    """libmagic MIME detector, or None if python-magic or libmagic is unavailable."""
+    try:
+        import magic
+    except ImportError:
+        # python-magic not installed, or libmagic not found
+        return None
+    try:
+        return magic.Magic(mime=True)
+    except (OSError, magic.MagicException):
+        # libmagic found, but its database could not be loaded
+        return None
+
+
+def _get_magic_detector():
+    """Process-wide libmagic detector, loaded on first use.
+    
+    Loading the magic database is the expensive part, so it happens once.
+    Magic objects serialize their own calls, so the instance is shared
+    between threads. Returns None if python-magic or libmagic is missing.
+    """
+    global _magic_detector, _magic_loaded
+    
+    if not _magic_loaded:
+        with _magic_lock:
+            if not _magic_loaded:
+                _magic_detector = _load_magic_detector()
+                _magic_loaded = True
+    
+    return _magic_detector
+
+
 def validate_pdf_magic_bytes(file_content: bytes) -> bool:
-    """Validate PDF using magic bytes (file signature)."""
+    """Validate PDF using magic bytes (file signature).
+    
+    Only the first MAGIC_SNIFF_BYTES are inspected, however much is passed.
+    """
     # Primary check: PDF files start with %PDF
     if len(file_content) < 4:
         return False
@@ -34,80 +135,241 @@ def validate_pdf_magic_bytes(file_content: bytes) -> bool:
         return False
     
     # Optional: Use python-magic if available for additional validation
-    try:
-        import magic
-        mime = magic.Magic(mime=True)
-        detected_type = mime.from_buffer(file_content)
-        return detected_type == "application/pdf"
-    except (ImportError, Exception):
+    detector = _get_magic_detector()
+    if detector is None:
         # Fallback: if python-magic is not available, trust the %PDF signature
         return True
+    
+    from magic import MagicException
+    
+    try:
+        return detector.from_buffer(file_content[:MAGIC_SNIFF_BYTES]) == "application/pdf"
+    except MagicException:
+        return True
 
 
-def save_pdf_file(file: UploadFile) -> Tuple[str, int]:
-    """Save uploaded PDF file with GUID name.
+def validate_pdf_structure(fileobj: BinaryIO) -> bool:
+    """Check that a PDF ends with a trailer and a cross-reference.
+    
+    Reads the last PDF_TAIL_BYTES via seek and requires a final
+    "startxref <offset> %%EOF" plus an xref table, trailer or xref stream
+    marker before it. Truncated uploads and files that merely start with
+    %PDF fail. A startxref offset that does not land on the cross-reference
+    is only logged: viewers rebuild the table, so such files still open.
+    Never loads the document; the stream is left at position 0.
     
     Returns:
-        Tuple of (file_url, file_size)
+        True if the structure looks valid (or the stream is not seekable)
     """
-    # Read file content
-    file_content = file.file.read()
-    file_size = len(file_content)
+    if not fileobj.seekable():
+        return True
     
-    # Validate file size
-    if file_size > settings.max_file_size_bytes:
-        raise HTTPException(
-            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-            detail=f"File size exceeds maximum allowed size of {settings.max_file_size_mb}MB"
-        )
+    try:
+        size = fileobj.seek(0, 2)
+        tail_start = max(size - PDF_TAIL_BYTES, 0)
+        fileobj.seek(tail_start)
+        tail = fileobj.read(PDF_TAIL_BYTES)
+        
+        matches = list(STARTXREF_PATTERN.finditer(tail))
+        if not matches:
+            return False
+        startxref = matches[-1]
+        if XREF_MARKER_PATTERN.search(tail, 0, startxref.start()) is None:
+            return False
+        
+        offset = int(startxref.group(1))
+        if offset < size:
+            fileobj.seek(offset)
+            offset_ok = XREF_PATTERN.match(fileobj.read(32)) is not None
+        else:
+            offset_ok = False
+        if not offset_ok:
+            logger.warning("PDF startxref offset %d does not point at a cross-reference; accepting", offset)
+        return True
+    finally:
+        fileobj.seek(0)
+
+
+def content_path(content_hash: str) -> str:
+    """Relative path of a content-addressed file.
+    
+    Two levels of fan-out keep directories small: a digest starting
+    "abcd" is stored as ab/cd/<digest>.pdf.
+    """
+    return f"{content_hash[:2]}/{content_hash[2:4]}/{content_hash}.pdf"
+
+
+class _UploadStream:
+    """Chunks of an upload, validated and hashed as they are read.
+    
+    Raises 400 if the first chunk lacks the PDF signature or the upload is
+    empty, and 413 as soon as the running size passes the limit.
+    """
+    
+    def __init__(self, file: UploadFile):
+        self.file = file
+        self.size = 0
+        self.digest = hashlib.sha256()
+    
+    def __iter__(self) -> Iterator[bytes]:
+        while True:
+            chunk = self.file.file.read(UPLOAD_CHUNK_SIZE)
+            if not chunk:
+                break
+            
+            # Validate magic bytes before storing anything
+            if self.size == 0:
+                started = time.perf_counter()
+                is_pdf = validate_pdf_magic_bytes(chunk)
+                upload_timings.record("sniff", time.perf_counter() - started)
+                if not is_pdf:
+                    raise HTTPException(
+                        status_code=status.HTTP_400_BAD_REQUEST,
+                        detail="File is not a valid PDF"
+                    )
+            
+            # Validate file size
+            self.size += len(chunk)
+            if self.size > settings.max_file_size_bytes:
+                raise HTTPException(
+                    status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                    detail=f"File size exceeds maximum allowed size of {settings.max_file_size_mb}MB"
+                )
+            
+            self.digest.update(chunk)
+            yield chunk
+        
+        if self.size == 0:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="File is not a valid PDF"
+            )
+
+
+def _file_lock_key(file_url: str) -> int:
+    """PostgreSQL advisory lock key for a stored file (signed 64-bit)."""
+    return int.from_bytes(hashlib.sha256(file_url.encode()).digest()[:8], "big", signed=True)
+
+
+def _uses_advisory_locks(db: Session) -> bool:
+    # Only PostgreSQL has advisory locks; the SQLite test database skips them
+    return db.get_bind().dialect.name == "postgresql"
+
+
+def save_pdf_file(file: UploadFile, db: Session) -> Tuple[str, int, str]:
+    """Save uploaded PDF file to the storage backend.
+    
+    The PDF trailer is checked first from the tail of the spooled upload.
+    The upload is then streamed to storage in UPLOAD_CHUNK_SIZE chunks: the
+    PDF signature is checked on the first chunk, the SHA-256 is computed as
+    chunks pass, and the upload aborts with 413 as soon as the running size
+    passes the limit. Backends only expose a file once it is complete, so a
+    partial upload is never visible under its final name. Phase durations
+    are recorded in `upload_timings`.
     
-    # Validate magic bytes
-    if not validate_pdf_magic_bytes(file_content):
+    Files are stored under a new GUID name, or with CONTENT_ADDRESSED_STORAGE
+    under their digest; an upload whose digest is already stored is
+    discarded and the existing file is shared. In that case the file is
+    locked in `db`'s transaction, so commit the resource row that references
+    it promptly: until then `release_file` waits instead of unlinking it.
+    
+    Returns:
+        Tuple of (file_url, file_size, content_hash)
+    """
+    started = time.perf_counter()
+    is_valid = validate_pdf_structure(file.file)
+    structure_seconds = time.perf_counter() - started
+    upload_timings.record("structure", structure_seconds)
+    if not is_valid:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="File is not a valid PDF"
+            detail="File is not a valid PDF (missing trailer or cross-reference table)"
         )
     
-    # Generate GUID filename
-    file_id = str(uuid.uuid4())
-    filename = f"{file_id}.pdf"
+    upload = _UploadStream(file)
+    started = time.perf_counter()
     
-    # Ensure upload directory exists
-    upload_dir = Path(settings.upload_dir)
-    upload_dir.mkdir(parents=True, exist_ok=True)
+    if settings.content_addressed_storage:
+        # The final key depends on the digest, so store under a temporary
+        # key and move the file once the upload is complete
+        temp_key = f"tmp/{uuid.uuid4()}.pdf"
+        storage.put(temp_key, upload, "application/pdf")
+        content_hash = upload.digest.hexdigest()
+        filename = content_path(content_hash)
+        try:
+            if _uses_advisory_locks(db):
+                # Held until the caller commits, so a concurrent release_file
+                # cannot unlink the file between this check and the new row
+                db.execute(
+                    text("SELECT pg_advisory_xact_lock(:key)"),
+                    {"key": _file_lock_key(f"uploads/{filename}")}
+                )
+            if storage.stat(filename) is None:
+                storage.rename(temp_key, filename)
+            else:
+                # Duplicate content: the stored file is the same bytes
+                storage.delete(temp_key)
+        except BaseException:
+            storage.delete(temp_key)
+            raise
+    else:
+        filename = f"{uuid.uuid4()}.pdf"
+        storage.put(filename, upload, "application/pdf")
+        content_hash = upload.digest.hexdigest()
     
-    # Save file
-    file_path = upload_dir / filename
-    with open(file_path, "wb") as f:
-        f.write(file_content)
+    store_seconds = time.perf_counter() - started
+    upload_timings.record("store", store_seconds)
+    logger.debug(
+        "Stored %s (%d bytes): structure %.2f ms, store %.2f ms",
+        filename, upload.size, structure_seconds * 1000, store_seconds * 1000
+    )
     
     # Return relative path for database storage
     file_url = f"uploads/{filename}"
     
-    return file_url, file_size
-
-
-def get_file_path(file_url: str) -> Path:
-    """Get full file path from database file_url."""
-    return Path(file_url)
+    return file_url, upload.size, content_hash
 
 
 def delete_file(file_url: str) -> bool:
-    """Delete a file from the filesystem.
+    """Delete a file from storage.
     
     Returns:
         True if file was deleted, False if it didn't exist
     """
-    file_path = Path(file_url)
-    
-    if file_path.exists() and file_path.is_file():
-        file_path.unlink()
-        return True
-    
-    return False
+    return storage.delete(storage_key(file_url))
 
 
 def file_exists(file_url: str) -> bool:
     """Check if a file exists."""
-    file_path = Path(file_url)
-    return file_path.exists() and file_path.is_file()
+    return storage.stat(storage_key(file_url)) is not None
+
+
+def release_file(db: Session, file_url: str) -> bool:
+    """Delete a file once no resource references it.
+    
+    Call after committing the change that dropped the reference. Files are
+    shared between resources under content-addressed storage, so the
+    remaining references are counted (an indexed lookup) and the file is
+    unlinked only when the last one is gone. The count and unlink hold the
+    file's advisory lock, which an upload sharing the file keeps until its
+    resource row is committed, so that row is always counted.
+    
+    Returns:
+        True if the file was deleted
+    """
+    if not _uses_advisory_locks(db):
+        return _release_unreferenced(db, file_url)
+    
+    key = _file_lock_key(file_url)
+    db.execute(text("SELECT pg_advisory_lock(:key)"), {"key": key})
+    try:
+        return _release_unreferenced(db, file_url)
+    finally:
+        db.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": key})
+
+
+def _release_unreferenced(db: Session, file_url: str) -> bool:
+    still_referenced = db.query(Resource.id).filter(Resource.file_url == file_url).first()
+    if still_referenced is not None:
+        return False
+    return delete_file(file_url)
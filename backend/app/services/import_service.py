@@ -0,0 +1,192 @@
+"""Bulk registration import service (CSV / JSONL)."""
+import codecs
+import csv
+import json
+from typing import IO, Any, Dict, Iterator, List, Set, Tuple
+from uuid import UUID
+from pydantic import ValidationError as PydanticValidationError
+from sqlalchemy.orm import Session
+from app.models import Event
+from app.schemas import RegistrationCreate, BulkImportReport, BulkImportRowResult
+from app.services.registration_service import insert_registrations, new_registration_values
+from app.utils.validation import sanitize_string, validation_error_message
+
+# Valid rows written per INSERT statement and commit
+IMPORT_CHUNK_SIZE = 1000
+
+SUPPORTED_FORMATS = ("csv", "jsonl")
+
+
+def _iter_text_lines(source: IO[bytes]) -> Iterator[str]:
+    """Decode a binary file as UTF-8 (with optional BOM), line by line.
+
+    Decoding per line rather than per buffer block means every row before
+    an undecodable line is still yielded.
+    """
+    for index, line in enumerate(source):
+        if index == 0 and line.startswith(codecs.BOM_UTF8):
+            line = line[len(codecs.BOM_UTF8):]
+        yield line.decode("utf-8")
+
+
+def _iter_csv_rows(text: Iterator[str]) -> Iterator[Tuple[int, Any]]:
+    """Yield (row number, dict) pairs from a CSV file with a header line."""
+    reader = csv.DictReader(text)
+    for row_number, row in enumerate(reader, start=1):
+        yield row_number, row
+
+
+def _iter_jsonl_rows(text: Iterator[str]) -> Iterator[Tuple[int, Any]]:
+    """Yield (row number, object) pairs from a JSON Lines file.
+
+    Lines that are not valid JSON are yielded as exceptions so they can be
+    reported as invalid rows without aborting the import.
+    """
+    row_number = 0
+    for line in text:
+        if not line.strip():
+            continue
+        row_number += 1
+        try:
+            yield row_number, json.loads(line)
+        except ValueError as exc:
+            yield row_number, exc
+
+
+def _format_error(exc: Exception) -> str:
+    """Flatten a validation error into a one-line message."""
+    if isinstance(exc, PydanticValidationError):
+        return "; ".join(
+            f"{'.'.join(str(loc) for loc in err['loc'])}: {validation_error_message(err)}" for err in exc.errors()
+        )
+    return str(exc)
+
+
+def _active_event_ids(db: Session, event_ids: Set[UUID], cache: Dict[UUID, bool]) -> None:
+    """Resolve which of the given event IDs are active, filling the cache."""
+    missing = [event_id for event_id in event_ids if event_id not in cache]
+    if not missing:
+        return
+
+    found = {
+        row.id for row in db.query(Event.id).filter(Event.id.in_(missing), Event.is_active == True)
+    }
+    for event_id in missing:
+        cache[event_id] = event_id in found
+
+
+def _flush_chunk(
+    db: Session,
+    chunk: List[Tuple[int, Dict[str, Any]]],
+    event_cache: Dict[UUID, bool],
+    results: List[BulkImportRowResult]
+) -> None:
+    """Insert one chunk of validated rows and record their outcomes."""
+    _active_event_ids(db, {values["event_id"] for _, values in chunk}, event_cache)
+
+    to_insert: Dict[Tuple[UUID, str], Tuple[int, Dict[str, Any]]] = {}
+    for row_number, values in chunk:
+        key = (values["event_id"], values["moodle_id"])
+        if not event_cache[values["event_id"]]:
+            results.append(BulkImportRowResult(
+                row=row_number, status="invalid", moodle_id=values["moodle_id"],
+                error=f"Event not found (ID: {values['event_id']})"
+            ))
+        elif key in to_insert:
+            results.append(BulkImportRowResult(row=row_number, status="duplicate", moodle_id=values["moodle_id"]))
+        else:
+            to_insert[key] = (row_number, values)
+
+    if not to_insert:
+        return
+
+    rows, _ = insert_registrations(db, [values for _, values in to_insert.values()])
+    db.commit()
+
+    inserted = {(row["event_id"], row["moodle_id"]): row for row in rows}
+
+    for key, (row_number, values) in to_insert.items():
+        row = inserted.get(key)
+        results.append(BulkImportRowResult(
+            row=row_number,
+            status="inserted" if row else "duplicate",
+            moodle_id=values["moodle_id"],
+            id=row["id"] if row else None,
+            registration_status=row["status"] if row else None
+        ))
+
+
+def import_registrations(db: Session, source: IO[bytes], fmt: str) -> BulkImportReport:
+    """Validate and insert registrations from a CSV or JSONL file.
+
+    Rows are validated with RegistrationCreate and sanitized like
+    POST /api/registrations, then written IMPORT_CHUNK_SIZE at a time with
+    multi-row INSERT ... ON CONFLICT DO NOTHING, one commit per chunk. Rows
+    beyond an event's capacity are inserted as waitlisted.
+
+    A line that is not valid UTF-8 or malformed CSV ends the import: rows
+    read before it are still written, and it is reported as an invalid row.
+
+    Args:
+        db: Database session
+        source: Binary file positioned at the start of the upload
+        fmt: "csv" (header row with event_id, operative_name, moodle_id) or "jsonl"
+
+    Returns:
+        Report with per-row outcomes (inserted / duplicate / invalid)
+    """
+    text = _iter_text_lines(source)
+    rows = _iter_csv_rows(text) if fmt == "csv" else _iter_jsonl_rows(text)
+
+    results: List[BulkImportRowResult] = []
+    event_cache: Dict[UUID, bool] = {}
+    chunk: List[Tuple[int, Dict[str, Any]]] = []
+    row_number = 0
+    read_error = None
+
+    try:
+        for row_number, raw in rows:
+            try:
+                if isinstance(raw, Exception):
+                    raise raw
+                if not isinstance(raw, dict):
+                    raise ValueError("Row must be an object")
+                data = RegistrationCreate.model_validate(raw)
+            except (PydanticValidationError, ValueError, TypeError) as exc:
+                moodle_id = raw.get("moodle_id") if isinstance(raw, dict) else None
+                results.append(BulkImportRowResult(
+                    row=row_number, status="invalid",
+                    moodle_id=moodle_id if isinstance(moodle_id, str) else None,
+                    error=_format_error(exc)
+                ))
+                continue
+
+            chunk.append((row_number, new_registration_values(
+                data.event_id,
+                sanitize_string(data.operative_name, max_length=100),
+                data.moodle_id
+            )))
+
+            if len(chunk) >= IMPORT_CHUNK_SIZE:
+                _flush_chunk(db, chunk, event_cache, results)
+                chunk = []
+    except UnicodeDecodeError:
+        read_error = "File is not valid UTF-8"
+    except csv.Error as exc:
+        # e.g. a field over csv.field_size_limit() or a NUL byte
+        read_error = f"Malformed CSV: {exc}"
+
+    # Rows validated before a read error are still written and reported
+    if chunk:
+        _flush_chunk(db, chunk, event_cache, results)
+
+    if read_error is not None:
+        # Reading stops at the row that could not be decoded or parsed
+        results.append(BulkImportRowResult(row=row_number + 1, status="invalid", error=read_error))
+
+    results.sort(key=lambda result: result.row)
+    counts = {"inserted": 0, "duplicate": 0, "invalid": 0}
+    for result in results:
+        counts[result.status] += 1
+
+    return BulkImportReport(total=len(results), rows=results, **counts)
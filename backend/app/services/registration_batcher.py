@@ -0,0 +1,139 @@
+"""Write batching for high-throughput registration ingestion."""
+import logging
+import queue
+import threading
+import time
+import uuid
+from concurrent.futures import Future
+from typing import Any, Dict, List, Optional, Tuple
+from app.config import settings
+from app.database import SessionLocal
+from app.services.registration_service import insert_registrations, new_registration_values
+from app.utils.errors import ConflictError
+
+logger = logging.getLogger(__name__)
+
+# (future, row values, event title for the conflict message)
+PendingRegistration = Tuple[Future, Dict[str, Any], str]
+
+
+class RegistrationBatcher:
+    """Group concurrent registration inserts into multi-row statements.
+
+    Callers submit a registration and get a Future back. A background thread
+    collects submissions for up to `window_ms` (or `max_batch` rows), then
+    writes them with one INSERT ... ON CONFLICT (event_id, moodle_id)
+    DO NOTHING RETURNING and a single commit, allocating seats to events with
+    a capacity and waitlisting the overflow. Each future resolves to the
+    inserted row as a dict and the event's registration_count after the
+    batch, or fails with ConflictError if the row was a duplicate, so
+    callers keep the one-request-one-row contract.
+    """
+
+    def __init__(self, window_ms: int = 5, max_batch: int = 500):
+        self.window_seconds = window_ms / 1000
+        self.max_batch = max_batch
+        self._queue: "queue.Queue[Optional[PendingRegistration]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        """Start the background writer thread if it is not running."""
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="registration-batcher", daemon=True
+                )
+                self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Flush pending submissions and stop the writer thread."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._queue.put(None)
+            thread.join(timeout)
+
+    def submit(self, event_id: uuid.UUID, operative_name: str, moodle_id: str, event_title: str) -> Future:
+        """Queue a registration insert.
+
+        Returns:
+            Future resolving to (inserted row as a dict, the event's
+            registration_count after the batch)
+        """
+        self.start()
+        future: Future = Future()
+        values = new_registration_values(event_id, operative_name, moodle_id)
+        self._queue.put((future, values, event_title))
+        return future
+
+    def _run(self) -> None:
+        """Writer loop: collect a batch, flush it, repeat until stopped."""
+        running = True
+        while running:
+            first = self._queue.get()
+            if first is None:
+                break
+
+            batch = [first]
+            deadline = time.monotonic() + self.window_seconds
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    running = False
+                    break
+                batch.append(item)
+
+            self._flush(batch)
+
+    def _flush(self, batch: List[PendingRegistration]) -> None:
+        """Insert one batch and resolve its futures."""
+        # Duplicates inside the batch would be silently dropped by
+        # ON CONFLICT, so only the first submission for a key is written
+        unique: Dict[Tuple[uuid.UUID, str], PendingRegistration] = {}
+        for pending in batch:
+            future, values, event_title = pending
+            key = (values["event_id"], values["moodle_id"])
+            if key in unique:
+                future.set_exception(self._conflict(values, event_title))
+            else:
+                unique[key] = pending
+
+        db = SessionLocal()
+        try:
+            rows, registration_counts = insert_registrations(db, [values for _, values, _ in unique.values()])
+            db.commit()
+        except Exception as exc:
+            db.rollback()
+            logger.exception("Registration batch of %d rows failed", len(unique))
+            for future, _, _ in unique.values():
+                future.set_exception(exc)
+            return
+        finally:
+            db.close()
+
+        inserted = {(row["event_id"], row["moodle_id"]): row for row in rows}
+        for key, (future, values, event_title) in unique.items():
+            row = inserted.get(key)
+            if row is None:
+                future.set_exception(self._conflict(values, event_title))
+            else:
+                future.set_result((row, registration_counts[row["event_id"]]))
+
+    @staticmethod
+    def _conflict(values: Dict[str, Any], event_title: str) -> ConflictError:
+        return ConflictError(
+            f"Registration already exists for Moodle ID {values['moodle_id']} and event {event_title}"
+        )
+
+
+registration_batcher = RegistrationBatcher(
+    window_ms=settings.registration_batch_window_ms,
+    max_batch=settings.registration_batch_max_size
+)
@@ -0,0 +1,196 @@
+"""Shared registration write helpers."""
+import uuid
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Dict, List, Tuple
+from sqlalchemy import update, or_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+from app.models import Registration, RegistrationStatus, Event
+from app.schemas import EventResponse
+
+# Extra SET values for counter-only event UPDATEs: assigning updated_at to
+# itself stops its onupdate from firing, so updated_at (and Last-Modified)
+# keeps meaning "last edited". Responses that include the counters must
+# cover them in their ETag instead.
+COUNTER_ONLY = {"updated_at": Event.updated_at}
+
+
+def new_registration_values(
+    event_id: uuid.UUID,
+    operative_name: str,
+    moodle_id: str,
+    status: RegistrationStatus = RegistrationStatus.CONFIRMED
+) -> Dict[str, Any]:
+    """Column values for a new registration, with client-side id and timestamp."""
+    return {
+        "id": uuid.uuid4(),
+        "event_id": event_id,
+        "operative_name": operative_name,
+        "moodle_id": moodle_id,
+        "status": status,
+        "timestamp": datetime.utcnow(),
+    }
+
+
+def build_registration_insert(rows: List[Dict[str, Any]]):
+    """Multi-row registration INSERT that skips (event_id, moodle_id) duplicates.
+
+    Returns the inserted rows; duplicates are simply absent from the result.
+    """
+    return (
+        insert(Registration)
+        .values(rows)
+        .on_conflict_do_nothing(index_elements=["event_id", "moodle_id"])
+        .returning(
+            Registration.id,
+            Registration.event_id,
+            Registration.operative_name,
+            Registration.moodle_id,
+            Registration.status,
+            Registration.timestamp,
+        )
+    )
+
+
+def build_registration_claim(event_id: uuid.UUID):
+    """UPDATE that takes one seat on an active event if one is free.
+
+    Returns the updated Event, or nothing if the event is missing, inactive
+    or full. The conditional update is atomic: concurrent claims serialize
+    on the row lock and re-check the seat condition, so an event can never
+    be overbooked. The lock is held until commit; rolling back (e.g. on a
+    duplicate) releases the seat.
+    """
+    return (
+        update(Event)
+        .where(
+            Event.id == event_id,
+            Event.is_active == True,
+            or_(Event.capacity == None, Event.registration_count < Event.capacity)
+        )
+        .values(registration_count=Event.registration_count + 1, **COUNTER_ONLY)
+        .returning(Event)
+    )
+
+
+def build_waitlist_claim(event_id: uuid.UUID):
+    """UPDATE that adds one waitlisted registration to an active event.
+
+    Used after build_registration_claim found no free seat. Returns the
+    updated Event, or nothing if the event is missing or inactive.
+    """
+    return (
+        update(Event)
+        .where(Event.id == event_id, Event.is_active == True)
+        .values(waitlist_count=Event.waitlist_count + 1, **COUNTER_ONLY)
+        .returning(Event)
+    )
+
+
+def insert_registrations(
+    db: Session,
+    rows: List[Dict[str, Any]]
+) -> Tuple[List[Dict[str, Any]], Dict[uuid.UUID, int]]:
+    """Insert many registrations, allocating seats and maintaining counters.
+
+    Locks the affected events, inserts all rows with ON CONFLICT DO NOTHING,
+    confirms inserted rows in submission order while seats remain and
+    waitlists the rest, then updates each event's counters. Must be
+    followed by a commit; the event locks are held until then.
+
+    Returns:
+        The inserted rows (duplicates omitted) with their final status, and
+        each event's registration_count once the rows are counted
+    """
+    event_ids = sorted({row["event_id"] for row in rows})
+
+    # Lock in a stable order so concurrent batches cannot deadlock
+    events = {
+        event.id: (event.capacity, event.registration_count)
+        for event in db.query(Event.id, Event.capacity, Event.registration_count)
+        .filter(Event.id.in_(event_ids))
+        .order_by(Event.id)
+        .with_for_update()
+    }
+
+    order = {row["id"]: position for position, row in enumerate(rows)}
+    inserted = [dict(row) for row in db.execute(build_registration_insert(rows)).mappings()]
+    inserted.sort(key=lambda row: order[row["id"]])
+
+    by_event: Dict[uuid.UUID, List[Dict[str, Any]]] = defaultdict(list)
+    for row in inserted:
+        by_event[row["event_id"]].append(row)
+
+    # The events are locked, so the counters read above are current
+    registration_counts = {event_id: count for event_id, (_, count) in events.items()}
+
+    for event_id, event_rows in by_event.items():
+        capacity, registration_count = events[event_id]
+        seats = len(event_rows) if capacity is None else max(capacity - registration_count, 0)
+
+        waitlisted = event_rows[seats:]
+        for row in waitlisted:
+            row["status"] = RegistrationStatus.WAITLISTED
+
+        if waitlisted:
+            db.execute(
+                update(Registration)
+                .where(Registration.id.in_([row["id"] for row in waitlisted]))
+                .values(status=RegistrationStatus.WAITLISTED)
+                .execution_options(synchronize_session=False)
+            )
+
+        db.execute(
+            update(Event)
+            .where(Event.id == event_id)
+            .values(
+                registration_count=Event.registration_count + len(event_rows) - len(waitlisted),
+                waitlist_count=Event.waitlist_count + len(waitlisted),
+                **COUNTER_ONLY
+            )
+        )
+        registration_counts[event_id] += len(event_rows) - len(waitlisted)
+
+    return inserted, registration_counts
+
+
+def event_response_with_count(event: Event, registration_count: int) -> EventResponse:
+    """EventResponse for an event loaded before its counter last changed."""
+    return EventResponse.model_validate(event).model_copy(update={"registration_count": registration_count})
+
+
+def promote_waitlist(db: Session, event: Event) -> int:
+    """Confirm the oldest waitlisted registrations into any free seats.
+
+    The event row must be locked (SELECT ... FOR UPDATE) by the caller.
+
+    Returns:
+        Number of registrations promoted
+    """
+    if event.waitlist_count == 0:
+        return 0
+
+    free = event.waitlist_count if event.capacity is None else event.capacity - event.registration_count
+    if free <= 0:
+        return 0
+
+    promote_ids = [
+        row.id for row in db.query(Registration.id)
+        .filter(Registration.event_id == event.id, Registration.status == RegistrationStatus.WAITLISTED)
+        .order_by(Registration.timestamp, Registration.id)
+        .limit(free)
+    ]
+    if not promote_ids:
+        return 0
+
+    db.execute(
+        update(Registration)
+        .where(Registration.id.in_(promote_ids))
+        .values(status=RegistrationStatus.CONFIRMED)
+        .execution_options(synchronize_session=False)
+    )
+    event.registration_count += len(promote_ids)
+    event.waitlist_count -= len(promote_ids)
+
+    return len(promote_ids)
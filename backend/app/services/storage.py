@@ -0,0 +1,278 @@
+"""Storage backends for uploaded resource files."""
+import os
+from abc import ABC, abstractmethod
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, Iterator, NamedTuple, Optional
+from app.config import settings
+from app.utils.http_range import content_disposition
+
+# Bytes per chunk when reading a stored file
+READ_CHUNK_SIZE = 64 * 1024
+
+# S3 rejects multipart parts smaller than this, except the last one
+S3_MIN_PART_SIZE = 5 * 1024 * 1024
+
+
+class StoredObject(NamedTuple):
+    """Size and modification time of a stored file."""
+    size: int
+    last_modified: datetime
+
+
+class StorageBackend(ABC):
+    """Where resource files live.
+
+    Files are addressed by a key relative to the storage root (e.g.
+    "<guid>.pdf" or "ab/cd/<sha256>.pdf"); `file_url` values stored on
+    resources map to keys with `storage_key`.
+    """
+
+    @abstractmethod
+    def put(self, key: str, chunks: Iterable[bytes], content_type: str) -> None:
+        """Store a file from a stream of chunks.
+
+        The file becomes visible under `key` only once every chunk has been
+        written; if the iterator raises, nothing is stored.
+        """
+
+    @abstractmethod
+    def get_stream(self, key: str, start: int = 0, end: Optional[int] = None) -> Iterator[bytes]:
+        """Yield the bytes of a file from `start` to `end` (inclusive)."""
+
+    @abstractmethod
+    def stat(self, key: str) -> Optional[StoredObject]:
+        """Size and modification time, or None if the file does not exist."""
+
+    @abstractmethod
+    def delete(self, key: str) -> bool:
+        """Delete a file. Returns False if it did not exist."""
+
+    @abstractmethod
+    def rename(self, source: str, target: str) -> None:
+        """Move a file to a new key, replacing any file already there."""
+
+    def presign(self, key: str, filename: str, media_type: str, expires_seconds: int) -> Optional[str]:
+        """Time-limited URL clients can download from directly.
+
+        Returns None if the backend cannot serve files itself, in which case
+        the API streams them.
+        """
+        return None
+
+
+class LocalStorage(StorageBackend):
+    """Files under a directory on this host (UPLOAD_DIR)."""
+
+    def __init__(self, root: str):
+        self.root = Path(root)
+
+    def _path(self, key: str) -> Path:
+        return self.root / key
+
+    def put(self, key: str, chunks: Iterable[bytes], content_type: str) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_name(f".{path.name}.part")
+        try:
+            with open(temp_path, "xb") as out:
+                for chunk in chunks:
+                    out.write(chunk)
+            # Atomic on the same filesystem
+            os.replace(temp_path, path)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
+
+    def get_stream(self, key: str, start: int = 0, end: Optional[int] = None) -> Iterator[bytes]:
+        with open(self._path(key), "rb") as f:
+            f.seek(start)
+            remaining = None if end is None else end - start + 1
+            while remaining is None or remaining > 0:
+                chunk = f.read(READ_CHUNK_SIZE if remaining is None else min(READ_CHUNK_SIZE, remaining))
+                if not chunk:
+                    break
+                if remaining is not None:
+                    remaining -= len(chunk)
+                yield chunk
+
+    def stat(self, key: str) -> Optional[StoredObject]:
+        path = self._path(key)
+        if not path.is_file():
+            return None
+        stat = path.stat()
+        return StoredObject(stat.st_size, datetime.utcfromtimestamp(int(stat.st_mtime)))
+
+    def delete(self, key: str) -> bool:
+        path = self._path(key)
+        if path.is_file():
+            path.unlink()
+            return True
+        return False
+
+    def rename(self, source: str, target: str) -> None:
+        target_path = self._path(target)
+        target_path.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(self._path(source), target_path)
+
+
+class S3Storage(StorageBackend):
+    """Files in an S3-compatible bucket (AWS S3, MinIO, Ceph RGW, ...).
+
+    Every API node sees the same files. Uploads are streamed as multipart
+    uploads of `part_size` parts, so at most one part is held in memory;
+    downloads can be handed to the bucket with presigned URLs.
+    """
+
+    def __init__(
+        self,
+        bucket: str,
+        prefix: str = "",
+        endpoint_url: Optional[str] = None,
+        public_endpoint_url: Optional[str] = None,
+        region: Optional[str] = None,
+        access_key_id: Optional[str] = None,
+        secret_access_key: Optional[str] = None,
+        part_size: int = 8 * 1024 * 1024
+    ):
+        import boto3
+        from botocore.config import Config
+
+        self.bucket = bucket
+        self.prefix = prefix
+        self.part_size = max(part_size, S3_MIN_PART_SIZE)
+
+        def make_client(endpoint: Optional[str]):
+            return boto3.client(
+                "s3",
+                endpoint_url=endpoint,
+                region_name=region,
+                aws_access_key_id=access_key_id,
+                aws_secret_access_key=secret_access_key,
+                config=Config(signature_version="s3v4", s3={"addressing_style": "path" if endpoint else "auto"})
+            )
+
+        self.client = make_client(endpoint_url)
+        # Presigned URLs must use a host the browser can reach, which may
+        # differ from the one the API uses (e.g. a container hostname)
+        self.presign_client = make_client(public_endpoint_url) if public_endpoint_url else self.client
+
+    def _key(self, key: str) -> str:
+        return f"{self.prefix}{key}"
+
+    def _is_missing(self, error) -> bool:
+        return error.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound")
+
+    def put(self, key: str, chunks: Iterable[bytes], content_type: str) -> None:
+        object_key = self._key(key)
+        buffer = bytearray()
+        parts = []
+        upload_id = None
+
+        try:
+            for chunk in chunks:
+                buffer += chunk
+                if len(buffer) < self.part_size:
+                    continue
+                if upload_id is None:
+                    upload_id = self.client.create_multipart_upload(
+                        Bucket=self.bucket, Key=object_key, ContentType=content_type
+                    )["UploadId"]
+                parts.append(self._upload_part(object_key, upload_id, len(parts) + 1, buffer))
+                buffer.clear()
+
+            if upload_id is None:
+                # Small file: a single request
+                self.client.put_object(
+                    Bucket=self.bucket, Key=object_key, Body=bytes(buffer), ContentType=content_type
+                )
+                return
+
+            if buffer:
+                parts.append(self._upload_part(object_key, upload_id, len(parts) + 1, buffer))
+            self.client.complete_multipart_upload(
+                Bucket=self.bucket, Key=object_key, UploadId=upload_id, MultipartUpload={"Parts": parts}
+            )
+        except BaseException:
+            if upload_id is not None:
+                self.client.abort_multipart_upload(Bucket=self.bucket, Key=object_key, UploadId=upload_id)
+            raise
+
+    def _upload_part(self, object_key: str, upload_id: str, number: int, data: bytearray) -> dict:
+        response = self.client.upload_part(
+            Bucket=self.bucket, Key=object_key, UploadId=upload_id, PartNumber=number, Body=bytes(data)
+        )
+        return {"PartNumber": number, "ETag": response["ETag"]}
+
+    def get_stream(self, key: str, start: int = 0, end: Optional[int] = None) -> Iterator[bytes]:
+        params = {"Bucket": self.bucket, "Key": self._key(key)}
+        if start or end is not None:
+            params["Range"] = f"bytes={start}-{'' if end is None else end}"
+        body = self.client.get_object(**params)["Body"]
+        try:
+            yield from body.iter_chunks(READ_CHUNK_SIZE)
+        finally:
+            body.close()
+
+    def stat(self, key: str) -> Optional[StoredObject]:
+        from botocore.exceptions import ClientError
+
+        try:
+            head = self.client.head_object(Bucket=self.bucket, Key=self._key(key))
+        except ClientError as e:
+            if self._is_missing(e):
+                return None
+            raise
+        last_modified = head["LastModified"].replace(tzinfo=None, microsecond=0)
+        return StoredObject(head["ContentLength"], last_modified)
+
+    def delete(self, key: str) -> bool:
+        # DeleteObject succeeds for missing keys, so check first
+        if self.stat(key) is None:
+            return False
+        self.client.delete_object(Bucket=self.bucket, Key=self._key(key))
+        return True
+
+    def rename(self, source: str, target: str) -> None:
+        self.client.copy_object(
+            Bucket=self.bucket,
+            Key=self._key(target),
+            CopySource={"Bucket": self.bucket, "Key": self._key(source)}
+        )
+        self.client.delete_object(Bucket=self.bucket, Key=self._key(source))
+
+    def presign(self, key: str, filename: str, media_type: str, expires_seconds: int) -> Optional[str]:
+        return self.presign_client.generate_presigned_url(
+            "get_object",
+            Params={
+                "Bucket": self.bucket,
+                "Key": self._key(key),
+                "ResponseContentDisposition": content_disposition(filename),
+                "ResponseContentType": media_type,
+            },
+            ExpiresIn=expires_seconds
+        )
+
+
+def storage_key(file_url: str) -> str:
+    """Storage key for a resource's file_url ("uploads/<key>")."""
+    return file_url.split("/", 1)[1] if file_url.startswith("uploads/") else file_url
+
+
+def create_storage() -> StorageBackend:
+    """Backend selected by STORAGE_BACKEND."""
+    if settings.storage_backend == "s3":
+        return S3Storage(
+            bucket=settings.s3_bucket,
+            prefix=settings.s3_key_prefix,
+            endpoint_url=settings.s3_endpoint_url or None,
+            public_endpoint_url=settings.s3_public_endpoint_url or None,
+            region=settings.s3_region or None,
+            access_key_id=settings.s3_access_key_id or None,
+            secret_access_key=settings.s3_secret_access_key or None,
+            part_size=settings.s3_multipart_part_size_mb * 1024 * 1024
+        )
+    return LocalStorage(settings.upload_dir)
+
+
+storage = create_storage()
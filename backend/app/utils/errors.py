@@ -12,11 +12,12 @@ class AppException(HTTPException):
         status_code: int,
         error_code: str,
         message: str,
-        details: Optional[Dict[str, Any]] = None
+        details: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None
     ):
         self.error_code = error_code
         self.details = details or {}
-        super().__init__(status_code=status_code, detail=message)
+        super().__init__(status_code=status_code, detail=message, headers=headers)
 
 
 def create_error_response(
@@ -90,6 +91,16 @@ class ConflictError(AppException):
         )
 
 
+class PayloadTooLargeError(AppException):
+    """413 Payload Too Large error."""
+    def __init__(self, message: str = "Request body too large"):
+        super().__init__(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            error_code="PAYLOAD_TOO_LARGE",
+            message=message
+        )
+
+
 class RateLimitError(AppException):
     """429 Rate limit error."""
     def __init__(self, message: str = "Rate limit exceeded"):
@@ -98,3 +109,14 @@ class RateLimitError(AppException):
             error_code="TOO_MANY_REQUESTS",
             message=message
         )
+
+
+class ServiceUnavailableError(AppException):
+    """503 Service Unavailable error."""
+    def __init__(self, message: str = "Service temporarily unavailable", retry_after: int = 1):
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            error_code="SERVICE_UNAVAILABLE",
+            message=message,
+            headers={"Retry-After": str(retry_after)}
+        )
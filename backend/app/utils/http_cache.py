@@ -0,0 +1,67 @@
+"""HTTP conditional request helpers (ETag / Last-Modified)."""
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Dict, Optional
+from fastapi import Request, Response, status
+
+
+def make_etag(*parts: Any) -> str:
+    """Build a strong ETag from the given validator parts."""
+    digest = hashlib.sha256("|".join(str(part) for part in parts).encode()).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def format_http_date(value: Optional[datetime]) -> Optional[str]:
+    """Format a naive UTC datetime as an HTTP-date."""
+    if value is None:
+        return None
+    return format_datetime(value.replace(tzinfo=timezone.utc, microsecond=0), usegmt=True)
+
+
+def validator_headers(etag: str, last_modified: Optional[datetime]) -> Dict[str, str]:
+    """Response headers advertising the validators.
+
+    `no-cache` lets clients store the body but makes them revalidate on
+    every use, which is cheap because matches are answered with 304.
+    """
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    http_date = format_http_date(last_modified)
+    if http_date:
+        headers["Last-Modified"] = http_date
+    return headers
+
+
+def is_not_modified(request: Request, etag: str, last_modified: Optional[datetime]) -> bool:
+    """Evaluate If-None-Match / If-Modified-Since against current validators.
+
+    If-None-Match takes precedence; If-Modified-Since is only consulted
+    when the client sent no entity tags (RFC 9110 section 13.2.2).
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        if if_none_match.strip() == "*":
+            return True
+        # Weak comparison: W/"x" matches "x"
+        candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return etag in candidates
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        return last_modified.replace(tzinfo=timezone.utc, microsecond=0) <= since
+
+    return False
+
+
+def not_modified_response(etag: str, last_modified: Optional[datetime]) -> Response:
+    """Build an empty 304 response carrying the validators."""
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers=validator_headers(etag, last_modified)
+    )
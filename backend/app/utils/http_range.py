@@ -0,0 +1,203 @@
+"""HTTP range request helpers (Range / If-Range) for file downloads."""
+import re
+import uuid
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import quote
+from fastapi import Request, Response, status
+from fastapi.responses import StreamingResponse
+from app.utils.http_cache import format_http_date
+
+# More ranges than this are answered with the full file instead, so a
+# request cannot make the server seek around a file thousands of times
+MAX_RANGES = 16
+
+ByteRange = Tuple[int, int]  # inclusive (first, last)
+
+# One range spec: "first-last", "first-" or "-suffix" (RFC 9110 section
+# 14.1.1). ASCII digits only; int() alone would also take "-5", "+5" or "5_0"
+_RANGE_SPEC = re.compile(r"(\d*)-(\d*)", re.ASCII)
+
+# Yields the bytes from first to last (inclusive) of the file being served
+RangeReader = Callable[[int, int], Iterator[bytes]]
+
+
+class RangeNotSatisfiable(Exception):
+    """No requested range overlaps the file (416)."""
+
+
+def parse_range_header(header: Optional[str], size: int) -> Optional[List[ByteRange]]:
+    """Parse a `bytes=` Range header against a file size.
+
+    Returns:
+        Sorted, coalesced inclusive ranges, or None if the header is
+        absent, malformed or asks for too many ranges (the full file
+        should be sent)
+
+    Raises:
+        RangeNotSatisfiable: If the header is well-formed but no range
+            overlaps the file
+    """
+    if not header:
+        return None
+    unit, _, spec = header.partition("=")
+    if unit.strip().lower() != "bytes" or not spec:
+        return None
+
+    parts = spec.split(",")
+    if len(parts) > MAX_RANGES:
+        return None
+
+    ranges: List[ByteRange] = []
+    for part in parts:
+        match = _RANGE_SPEC.fullmatch(part.strip())
+        if not match or not any(match.groups()):
+            return None
+        first, last = match.groups()
+        if first:
+            start = int(first)
+            end = int(last) if last else size - 1
+            if last and end < start:
+                return None
+        else:
+            # Suffix range: the last N bytes
+            suffix = int(last)
+            if suffix == 0:
+                continue
+            start, end = max(size - suffix, 0), size - 1
+        if start < size:
+            ranges.append((start, min(end, size - 1)))
+
+    if not ranges:
+        raise RangeNotSatisfiable()
+
+    ranges.sort()
+    merged = [ranges[0]]
+    for start, end in ranges[1:]:
+        last_start, last_end = merged[-1]
+        if start <= last_end + 1:
+            merged[-1] = (last_start, max(last_end, end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def if_range_matches(request: Request, etag: str, last_modified: datetime) -> bool:
+    """Whether a Range may be honoured given the request's If-Range.
+
+    Entity tags use strong comparison; dates must equal Last-Modified
+    exactly (RFC 9110 section 13.1.5).
+    """
+    if_range = request.headers.get("if-range")
+    if if_range is None:
+        return True
+    if_range = if_range.strip()
+    if if_range.startswith('"') or if_range.startswith("W/"):
+        return if_range == etag
+    try:
+        since = parsedate_to_datetime(if_range)
+    except (TypeError, ValueError):
+        return False
+    return format_http_date(last_modified) == format_http_date(since.replace(tzinfo=None))
+
+
+def content_disposition(filename: str) -> str:
+    """Attachment header with an RFC 5987 fallback for non-ASCII names."""
+    quoted = quote(filename)
+    if quoted != filename:
+        return f"attachment; filename*=utf-8''{quoted}"
+    return f'attachment; filename="{filename}"'
+
+
+def ranged_response(
+    request: Request,
+    size: int,
+    last_modified: datetime,
+    read_range: RangeReader,
+    filename: str,
+    media_type: str,
+    etag: str,
+    headers: Dict[str, str]
+) -> Response:
+    """Serve a file honouring If-None-Match, Range and If-Range.
+
+    Returns 304 when the client's copy is current, 206 with one range or a
+    multipart/byteranges body for several, 416 when no range is
+    satisfiable, and the full file otherwise.
+
+    Args:
+        read_range: Reads the file, so any storage backend can be served
+        headers: Extra headers for every response (e.g. Cache-Control)
+    """
+    base_headers = {
+        **headers,
+        "ETag": etag,
+        "Last-Modified": format_http_date(last_modified),
+        "Accept-Ranges": "bytes",
+        "Content-Disposition": content_disposition(filename),
+    }
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if "*" in candidates or etag in candidates:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=base_headers)
+
+    ranges = None
+    if if_range_matches(request, etag, last_modified):
+        try:
+            ranges = parse_range_header(request.headers.get("range"), size)
+        except RangeNotSatisfiable:
+            return Response(
+                status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+                headers={**base_headers, "Content-Range": f"bytes */{size}"}
+            )
+
+    if ranges is None:
+        return StreamingResponse(
+            read_range(0, size - 1),
+            media_type=media_type,
+            headers={**base_headers, "Content-Length": str(size)}
+        )
+
+    if len(ranges) == 1:
+        start, end = ranges[0]
+        return StreamingResponse(
+            read_range(start, end),
+            status_code=status.HTTP_206_PARTIAL_CONTENT,
+            media_type=media_type,
+            headers={
+                **base_headers,
+                "Content-Range": f"bytes {start}-{end}/{size}",
+                "Content-Length": str(end - start + 1),
+            }
+        )
+
+    boundary = uuid.uuid4().hex
+    part_headers = [
+        (
+            f"--{boundary}\r\nContent-Type: {media_type}\r\n"
+            f"Content-Range: bytes {start}-{end}/{size}\r\n\r\n"
+        ).encode("latin-1")
+        for start, end in ranges
+    ]
+    closing = f"\r\n--{boundary}--\r\n".encode("latin-1")
+    content_length = (
+        sum(len(head) + end - start + 1 for head, (start, end) in zip(part_headers, ranges))
+        + 2 * (len(ranges) - 1)  # CRLF before each following boundary
+        + len(closing)
+    )
+
+    def iter_parts() -> Iterator[bytes]:
+        for index, (head, (start, end)) in enumerate(zip(part_headers, ranges)):
+            yield (b"\r\n" + head) if index else head
+            yield from read_range(start, end)
+        yield closing
+
+    return StreamingResponse(
+        iter_parts(),
+        status_code=status.HTTP_206_PARTIAL_CONTENT,
+        media_type=f"multipart/byteranges; boundary={boundary}",
+        headers={**base_headers, "Content-Length": str(content_length)}
+    )
@@ -0,0 +1,88 @@
+"""Keyset (cursor) pagination utilities."""
+import base64
+import json
+from typing import Any, List, Optional, Tuple, Type
+from uuid import UUID
+from sqlalchemy import tuple_
+from sqlalchemy.orm import Query
+from app.utils.errors import ValidationError
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+
+def encode_cursor(sort_value: Any, row_id: UUID) -> str:
+    """Encode a (sort key, id) pair into an opaque URL-safe cursor."""
+    raw = json.dumps([sort_value.isoformat(), str(row_id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, key_type: Type) -> Tuple[Any, UUID]:
+    """Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: Opaque cursor string from a previous page
+        key_type: date or datetime, used to parse the sort key
+
+    Raises:
+        ValidationError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort_value, row_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return key_type.fromisoformat(sort_value), UUID(row_id)
+    except (ValueError, TypeError):
+        raise ValidationError("Invalid pagination cursor", {"cursor": cursor})
+
+
+def apply_keyset(
+    query,
+    sort_column,
+    id_column,
+    key_type: Type,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None
+):
+    """Restrict a Query or Select to one page past the cursor.
+
+    Seeks with WHERE (sort, id) < (:sort, :id) instead of OFFSET, so every
+    page costs the same regardless of its position. One extra row is
+    fetched to detect whether another page follows.
+
+    Returns:
+        Tuple of (query, limit)
+    """
+    limit = limit or DEFAULT_PAGE_SIZE
+
+    if cursor:
+        sort_value, row_id = decode_cursor(cursor, key_type)
+        query = query.filter(tuple_(sort_column, id_column) < tuple_(sort_value, row_id))
+
+    return query.order_by(sort_column.desc(), id_column.desc()).limit(limit + 1), limit
+
+
+def finish_page(rows: List[Any], limit: int, sort_column, id_column) -> Tuple[List[Any], Optional[str]]:
+    """Trim the look-ahead row and build the next cursor."""
+    if len(rows) <= limit:
+        return rows, None
+
+    rows = rows[:limit]
+    last = rows[-1]
+    return rows, encode_cursor(getattr(last, sort_column.key), getattr(last, id_column.key))
+
+
+def paginate_keyset(
+    query: Query,
+    sort_column,
+    id_column,
+    key_type: Type,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None
+) -> Tuple[List[Any], Optional[str]]:
+    """Fetch one page of a query ordered by (sort_column, id_column) descending.
+
+    Returns:
+        Tuple of (rows, next_cursor); next_cursor is None on the last page
+    """
+    query, limit = apply_keyset(query, sort_column, id_column, key_type, limit, cursor)
+    return finish_page(query.all(), limit, sort_column, id_column)
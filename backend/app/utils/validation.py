@@ -1,6 +1,33 @@
 """Input validation and sanitization utilities."""
+import re
+import threading
 import bleach
-from typing import Optional
+from typing import Any, Dict, Optional
+from app.schemas import PATTERN_MESSAGES
+
+# Tags kept by sanitize_text (basic formatting, no scripts)
+ALLOWED_TEXT_TAGS = ['p', 'br', 'strong', 'em', 'u', 'ul', 'ol', 'li']
+
+# The only characters bleach.clean ever changes in text: markup, entity
+# starts and C0 controls other than tab and newline. Input without them
+# comes back unchanged, so the HTML parse can be skipped.
+_MARKUP_SIGNIFICANT = re.compile(r'[\x00-\x08\x0b-\x1f&<>]')
+
+# bleach Cleaners hold html5lib parser state and are not thread-safe, so
+# each worker thread builds its own pair once and reuses it
+_cleaners = threading.local()
+
+
+def _get_cleaners():
+    """Per-thread (string cleaner, text cleaner)."""
+    cleaners = getattr(_cleaners, "pair", None)
+    if cleaners is None:
+        cleaners = (
+            bleach.Cleaner(tags=[], attributes={}, strip=True),
+            bleach.Cleaner(tags=ALLOWED_TEXT_TAGS, attributes={}, strip=True),
+        )
+        _cleaners.pair = cleaners
+    return cleaners
 
 
 def sanitize_string(input_str: str, max_length: Optional[int] = None) -> str:
@@ -8,13 +35,11 @@ def sanitize_string(input_str: str, max_length: Optional[int] = None) -> str:
     if not isinstance(input_str, str):
         return ""
     
-    # Remove HTML tags and dangerous characters
-    cleaned = bleach.clean(
-        input_str,
-        tags=[],  # Remove all HTML tags
-        attributes={},
-        strip=True
-    )
+    # Remove HTML tags and dangerous characters (plain text needs no parse)
+    if _MARKUP_SIGNIFICANT.search(input_str):
+        cleaned = _get_cleaners()[0].clean(input_str)
+    else:
+        cleaned = input_str
     
     # Trim whitespace
     cleaned = cleaned.strip()
@@ -32,12 +57,16 @@ def sanitize_text(input_str: str) -> str:
         return ""
     
     # Allow basic formatting but remove scripts
-    allowed_tags = ['p', 'br', 'strong', 'em', 'u', 'ul', 'ol', 'li']
-    cleaned = bleach.clean(
-        input_str,
-        tags=allowed_tags,
-        attributes={},
-        strip=True
-    )
+    if _MARKUP_SIGNIFICANT.search(input_str):
+        cleaned = _get_cleaners()[1].clean(input_str)
+    else:
+        cleaned = input_str
     
     return cleaned.strip()
+
+
+def validation_error_message(error: Dict[str, Any]) -> str:
+    """Message for one pydantic error, worded for users for known formats."""
+    if error.get("type") == "string_pattern_mismatch":
+        return PATTERN_MESSAGES.get(error.get("ctx", {}).get("pattern"), error["msg"])
+    return error["msg"]
@@ -0,0 +1,30 @@
+"""Keyset pagination indexes
+
+Revision ID: 3f1c9a7d2b10
+Revises: 0eb22388b1d4
+Create Date: 2026-10-17 10:12:04.511823
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f1c9a7d2b10'
+down_revision = '0eb22388b1d4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_events_date_id', 'events', ['date', 'id'], unique=False)
+    op.create_index('ix_registrations_timestamp_id', 'registrations', ['timestamp', 'id'], unique=False)
+    op.create_index('ix_registrations_event_timestamp_id', 'registrations', ['event_id', 'timestamp', 'id'], unique=False)
+    op.create_index('ix_hackathon_teams_created_at_id', 'hackathon_teams', ['created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_hackathon_teams_created_at_id', table_name='hackathon_teams')
+    op.drop_index('ix_registrations_event_timestamp_id', table_name='registrations')
+    op.drop_index('ix_registrations_timestamp_id', table_name='registrations')
+    op.drop_index('ix_events_date_id', table_name='events')
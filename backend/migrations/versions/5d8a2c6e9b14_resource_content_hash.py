@@ -0,0 +1,32 @@
+"""Resource content hash for deduplicated storage
+
+Revision ID: 5d8a2c6e9b14
+Revises: e91b3c0a7f45
+Create Date: 2026-10-17 15:02:41.377920
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5d8a2c6e9b14'
+down_revision = 'e91b3c0a7f45'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('resources', sa.Column('content_hash', sa.String(length=64), nullable=True))
+    op.create_index(op.f('ix_resources_content_hash'), 'resources', ['content_hash'], unique=False)
+    # Deduplicated resources share a file, so file_url is indexed for
+    # reference counting instead of unique
+    op.drop_constraint('resources_file_url_key', 'resources', type_='unique')
+    op.create_index(op.f('ix_resources_file_url'), 'resources', ['file_url'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_resources_file_url'), table_name='resources')
+    op.create_unique_constraint('resources_file_url_key', 'resources', ['file_url'])
+    op.drop_index(op.f('ix_resources_content_hash'), table_name='resources')
+    op.drop_column('resources', 'content_hash')
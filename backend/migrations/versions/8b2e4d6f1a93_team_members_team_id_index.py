@@ -0,0 +1,24 @@
+"""Index team_members.team_id
+
+Revision ID: 8b2e4d6f1a93
+Revises: 3f1c9a7d2b10
+Create Date: 2026-10-17 11:02:47.208316
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8b2e4d6f1a93'
+down_revision = '3f1c9a7d2b10'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(op.f('ix_team_members_team_id'), 'team_members', ['team_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_team_members_team_id'), table_name='team_members')
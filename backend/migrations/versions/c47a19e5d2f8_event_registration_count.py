@@ -0,0 +1,29 @@
+"""Add events.registration_count
+
+Revision ID: c47a19e5d2f8
+Revises: 8b2e4d6f1a93
+Create Date: 2026-10-17 11:41:19.730254
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c47a19e5d2f8'
+down_revision = '8b2e4d6f1a93'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('events', sa.Column('registration_count', sa.Integer(), server_default='0', nullable=False))
+    # Backfill from existing registrations
+    op.execute(
+        "UPDATE events SET registration_count = "
+        "(SELECT count(*) FROM registrations WHERE registrations.event_id = events.id)"
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('events', 'registration_count')
@@ -0,0 +1,32 @@
+"""Event capacity and registration waitlist
+
+Revision ID: e91b3c0a7f45
+Revises: c47a19e5d2f8
+Create Date: 2026-10-17 12:26:08.914372
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e91b3c0a7f45'
+down_revision = 'c47a19e5d2f8'
+branch_labels = None
+depends_on = None
+
+registration_status = sa.Enum('CONFIRMED', 'WAITLISTED', name='registrationstatus')
+
+
+def upgrade() -> None:
+    op.add_column('events', sa.Column('capacity', sa.Integer(), nullable=True))
+    op.add_column('events', sa.Column('waitlist_count', sa.Integer(), server_default='0', nullable=False))
+    registration_status.create(op.get_bind(), checkfirst=True)
+    op.add_column('registrations', sa.Column('status', registration_status, server_default='CONFIRMED', nullable=False))
+
+
+def downgrade() -> None:
+    op.drop_column('registrations', 'status')
+    registration_status.drop(op.get_bind(), checkfirst=True)
+    op.drop_column('events', 'waitlist_count')
+    op.drop_column('events', 'capacity')
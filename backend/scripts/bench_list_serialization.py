@@ -0,0 +1,93 @@
+"""
+List Serialization Benchmark
+Measures per-request CPU for a 1k-item event list serialized three ways:
+response_model + stdlib JSONResponse (the old default), response_model +
+ORJSONResponse (the new default), and validate-once + dump_json bytes
+(what the list endpoints now do)
+"""
+
+import argparse
+import sys
+import time
+import uuid
+from datetime import date, datetime
+from pathlib import Path
+from typing import List
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fastapi import FastAPI, Response
+from fastapi.responses import JSONResponse, ORJSONResponse
+from fastapi.testclient import TestClient
+from pydantic import TypeAdapter
+from app.models import Event, EventType
+from app.schemas import EventResponse
+
+event_list_adapter = TypeAdapter(List[EventResponse])
+
+
+def make_events(count):
+    """Transient Event rows shaped like a real listing"""
+    now = datetime.utcnow()
+    return [
+        Event(
+            id=uuid.uuid4(),
+            title=f"Workshop {i}",
+            type=EventType.WORKSHOP,
+            date=date.today(),
+            description="Introduction to OWASP Top 10 vulnerabilities and secure coding practices.",
+            capacity=50,
+            is_active=True,
+            registration_count=i % 50,
+            created_at=now,
+            updated_at=now,
+        )
+        for i in range(count)
+    ]
+
+
+def build_app(events):
+    app = FastAPI()
+    
+    @app.get("/stdlib", response_model=List[EventResponse], response_class=JSONResponse)
+    def stdlib():
+        return events
+    
+    @app.get("/orjson", response_model=List[EventResponse], response_class=ORJSONResponse)
+    def orjson():
+        return events
+    
+    @app.get("/direct")
+    def direct():
+        body = event_list_adapter.dump_json(event_list_adapter.validate_python(events, from_attributes=True))
+        return Response(content=body, media_type="application/json")
+    
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=1000, help="Events per response")
+    parser.add_argument("--requests", type=int, default=200, help="Requests per variant")
+    args = parser.parse_args()
+    
+    client = TestClient(build_app(make_events(args.items)))
+    
+    results = {}
+    for name in ("stdlib", "orjson", "direct"):
+        # Warm up
+        bodies = {client.get(f"/{name}").content for _ in range(5)}
+        
+        start = time.process_time()
+        for _ in range(args.requests):
+            client.get(f"/{name}")
+        results[name] = (time.process_time() - start) / args.requests * 1000
+        
+        print(f"{name:<8} {results[name]:>8.2f} ms CPU/request  ({len(bodies.pop())} bytes)")
+    
+    print(f"{'speedup':<8} {results['stdlib'] / results['direct']:>8.2f}x (direct vs stdlib)")
+
+
+if __name__ == "__main__":
+    main()
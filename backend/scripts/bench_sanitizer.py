@@ -0,0 +1,45 @@
+"""
+Sanitizer Benchmark
+Times sanitize_string against a plain bleach.clean call (the previous
+implementation) on typical plain-text form fields. Output equivalence is
+covered by tests/test_validation.py.
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import bleach
+from app.utils.validation import sanitize_string
+
+FIELDS = ["Ada Lovelace", "ada.lovelace@example.edu", "Computer Engineering", "TE", "A", "Null Pointers"]
+
+
+def reference_string(value, max_length=None):
+    cleaned = bleach.clean(value, tags=[], attributes={}, strip=True).strip()
+    if max_length and len(cleaned) > max_length:
+        cleaned = cleaned[:max_length]
+    return cleaned
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=20000, help="Calls per implementation")
+    args = parser.parse_args()
+    
+    for name, func in (("bleach.clean", reference_string), ("sanitize_string", sanitize_string)):
+        start = time.perf_counter()
+        for i in range(args.iterations):
+            func(FIELDS[i % len(FIELDS)], 100)
+        elapsed = time.perf_counter() - start
+        print(f"{name:<16} {elapsed / args.iterations * 1e6:>8.2f} us per plain-text field")
+    
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
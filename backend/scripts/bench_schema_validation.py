@@ -0,0 +1,126 @@
+"""
+Schema Validation Benchmark
+Measures HackathonTeamCreate validations/sec against an equivalent model
+built the old way (v1-style @validator, regex recompiled per call, mobile
+checked twice)
+"""
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+from typing import List
+from uuid import UUID
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pydantic import BaseModel, EmailStr, Field, ValidationError, validator
+from app.schemas import HackathonTeamCreate, RegistrationCreate
+
+
+class LegacyTeamMember(BaseModel):
+    name: str = Field(..., min_length=1, max_length=100)
+    email: EmailStr
+    moodle_id: str = Field(..., min_length=1, max_length=20)
+    roll_no: str = Field(..., min_length=1, max_length=20)
+    division: str = Field(..., min_length=1, max_length=5)
+    department: str = Field(..., min_length=1, max_length=100)
+    year: str = Field(..., min_length=1, max_length=10)
+    mobile: str = Field(..., pattern=r'^[0-9]{10}$')
+    is_leader: bool = False
+    
+    @validator('mobile')
+    def validate_mobile(cls, v):
+        if not v.isdigit() or len(v) != 10:
+            raise ValueError('Mobile number must be exactly 10 digits')
+        return v
+
+
+class LegacyHackathonTeamCreate(BaseModel):
+    event_name: str = Field(..., min_length=1, max_length=200)
+    team_name: str = Field(..., min_length=1, max_length=100)
+    team_members: List[LegacyTeamMember] = Field(..., min_length=4, max_length=4)
+    
+    @validator('team_members')
+    def validate_team_members(cls, v):
+        if len(v) != 4:
+            raise ValueError('Team must have exactly 4 members')
+        if len([m for m in v if m.is_leader]) != 1:
+            raise ValueError('Team must have exactly 1 leader')
+        return v
+
+
+class LegacyRegistrationCreate(BaseModel):
+    event_id: UUID
+    operative_name: str = Field(..., min_length=1, max_length=100)
+    moodle_id: str = Field(..., min_length=1, max_length=20)
+    
+    @validator('moodle_id')
+    def validate_moodle_id(cls, v):
+        if not re.match(r'^[a-zA-Z0-9]{8,12}$', v):
+            raise ValueError('Moodle ID must be 8-12 alphanumeric characters')
+        return v
+
+
+TEAM_PAYLOAD = {
+    "event_name": "Hackathon 2026",
+    "team_name": "Null Pointers",
+    "team_members": [
+        {
+            "name": f"Member {i}",
+            "email": f"member{i}@example.edu",
+            "moodle_id": f"2210{i:04d}",
+            "roll_no": f"R{i:03d}",
+            "division": "A",
+            "department": "Computer Engineering",
+            "year": "TE",
+            "mobile": f"98765432{i:02d}",
+            "is_leader": i == 0,
+        }
+        for i in range(4)
+    ],
+}
+
+REGISTRATION_PAYLOAD = {
+    "event_id": "6f1c1f0e-8a6e-4d3b-9a43-6a1d8a2f8d10",
+    "operative_name": "Ada Lovelace",
+    "moodle_id": "ABCD12345",
+}
+
+
+def rate(model, payload, iterations):
+    """Validations per second for one model and payload"""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        model.model_validate(payload)
+    return iterations / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=20000, help="Validations per model")
+    args = parser.parse_args()
+    
+    # Both versions must accept and reject the same inputs
+    bad_team = dict(TEAM_PAYLOAD, team_members=[dict(m, mobile="12345") for m in TEAM_PAYLOAD["team_members"]])
+    for model in (HackathonTeamCreate, LegacyHackathonTeamCreate):
+        model.model_validate(TEAM_PAYLOAD)
+        try:
+            model.model_validate(bad_team)
+            raise SystemExit(f"{model.__name__} accepted an invalid mobile number")
+        except ValidationError:
+            pass
+    
+    for label, current, legacy, payload in (
+        ("HackathonTeamCreate", HackathonTeamCreate, LegacyHackathonTeamCreate, TEAM_PAYLOAD),
+        ("RegistrationCreate", RegistrationCreate, LegacyRegistrationCreate, REGISTRATION_PAYLOAD),
+    ):
+        old = rate(legacy, payload, args.iterations)
+        new = rate(current, payload, args.iterations)
+        print(f"{label:<20} legacy {old:>9.0f}/s   current {new:>9.0f}/s   {new / old:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Security Headers Middleware Benchmark
+Compares requests/sec of the pure ASGI middleware against a BaseHTTPMiddleware equivalent
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fastapi import FastAPI, Request
+from starlette.middleware.base import BaseHTTPMiddleware
+from app.middleware.security_headers import SecurityHeadersMiddleware, default_security_headers
+
+
+class BaseHTTPSecurityHeadersMiddleware(BaseHTTPMiddleware):
+    """The previous implementation: rebuilds every header per response."""
+    
+    async def dispatch(self, request: Request, call_next):
+        response = await call_next(request)
+        for name, value in default_security_headers().items():
+            response.headers[name] = value
+        return response
+
+
+def build_app(middleware_class):
+    app = FastAPI()
+    
+    @app.get("/ping")
+    def ping():
+        return {"status": "ok"}
+    
+    app.add_middleware(middleware_class)
+    return app
+
+
+async def run(app, requests):
+    """Drive the ASGI app in-process so only framework overhead is measured"""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/ping",
+        "raw_path": b"/ping",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 12345),
+        "server": ("bench", 80),
+    }
+    
+    async def send(message):
+        pass
+    
+    async def request():
+        messages = [{"type": "http.request", "body": b"", "more_body": False}]
+        
+        async def receive():
+            # Body first, then a disconnect once the response is done
+            return messages.pop() if messages else {"type": "http.disconnect"}
+        
+        await app(dict(scope), receive, send)
+    
+    # Warm up routing and dependency caches
+    for _ in range(100):
+        await request()
+    
+    start = time.perf_counter()
+    for _ in range(requests):
+        await request()
+    return requests / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=20000, help="Requests per implementation")
+    args = parser.parse_args()
+    
+    results = {}
+    for name, middleware_class in (
+        ("BaseHTTPMiddleware", BaseHTTPSecurityHeadersMiddleware),
+        ("pure ASGI", SecurityHeadersMiddleware),
+    ):
+        results[name] = asyncio.run(run(build_app(middleware_class), args.requests))
+        print(f"{name:<20} {results[name]:>10.0f} req/s")
+    
+    speedup = results["pure ASGI"] / results["BaseHTTPMiddleware"]
+    print(f"{'speedup':<20} {speedup:>10.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Argon2 Parameter Calibration
+Benchmarks time_cost/memory_cost/parallelism on this host and recommends
+the strongest settings whose p95 hash latency stays under a target while
+`--concurrency` hashes run at once (use ARGON2_MAX_WORKERS).
+
+Existing password hashes are upgraded to the new parameters on each
+user's next successful login.
+"""
+
+import argparse
+import os
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from argon2 import PasswordHasher
+
+SAMPLE_PASSWORD = "calibration-password"
+
+
+def measure(time_cost, memory_cost, parallelism, concurrency, rounds):
+    """Return (p50, p95) hash latency in ms with `concurrency` hashes in flight"""
+    ph = PasswordHasher(time_cost=time_cost, memory_cost=memory_cost, parallelism=parallelism)
+
+    def timed_hash(_):
+        start = time.perf_counter()
+        ph.hash(SAMPLE_PASSWORD)
+        return (time.perf_counter() - start) * 1000
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        # Warm up allocator and threads
+        list(pool.map(timed_hash, range(concurrency)))
+        latencies = sorted(pool.map(timed_hash, range(concurrency * rounds)))
+
+    p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+    return statistics.median(latencies), p95
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--target-ms", type=float, default=50, help="Maximum p95 latency per hash")
+    parser.add_argument(
+        "--concurrency", type=int, default=int(os.getenv("ARGON2_MAX_WORKERS", "2")),
+        help="Hashes running at once (defaults to ARGON2_MAX_WORKERS)"
+    )
+    parser.add_argument("--rounds", type=int, default=3, help="Hashes per thread per measurement")
+    parser.add_argument(
+        "--memory-mib", type=int, nargs="+", default=[19, 32, 46, 64, 128],
+        help="Memory costs to try, in MiB"
+    )
+    parser.add_argument("--parallelism", type=int, nargs="+", default=[1, 2, 4], help="Lane counts to try")
+    parser.add_argument("--max-time-cost", type=int, default=10, help="Highest time_cost to try")
+    args = parser.parse_args()
+
+    print(f"Target p95 {args.target_ms:.0f} ms with {args.concurrency} concurrent hashes "
+          f"(peak hashing memory = concurrency x memory_cost)\n")
+    print(f"{'memory':>8} {'lanes':>5} {'time':>4} {'p50 ms':>8} {'p95 ms':>8}")
+
+    candidates = []
+    for memory_mib in args.memory_mib:
+        memory_cost = memory_mib * 1024
+        for parallelism in args.parallelism:
+            for time_cost in range(1, args.max_time_cost + 1):
+                p50, p95 = measure(time_cost, memory_cost, parallelism, args.concurrency, args.rounds)
+                fits = p95 <= args.target_ms
+                print(f"{memory_mib:>6}Mi {parallelism:>5} {time_cost:>4} {p50:>8.1f} {p95:>8.1f}"
+                      f"{'' if fits else '  over target'}")
+                if not fits:
+                    break
+                candidates.append((memory_cost * time_cost, -p95, time_cost, memory_cost, parallelism))
+
+    if not candidates:
+        print("\nNo combination meets the target; raise --target-ms or lower --concurrency.")
+        return 1
+
+    # Strongest = most memory x passes (the cost an attacker pays per guess)
+    _, neg_p95, time_cost, memory_cost, parallelism = max(candidates)
+    print("\nRecommended settings:")
+    print(f"ARGON2_TIME_COST={time_cost}")
+    print(f"ARGON2_MEMORY_COST={memory_cost}")
+    print(f"ARGON2_PARALLELISM={parallelism}")
+    print(f"# p95 {-neg_p95:.1f} ms at concurrency {args.concurrency}, "
+          f"{memory_cost * args.concurrency // 1024} MiB peak per worker process")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,92 @@
+"""Move existing resource files into content-addressed storage.
+
+Hashes every resource's file, stores it under ab/cd/<sha256>.pdf in the
+configured storage backend (sharing one copy between identical files),
+updates file_url and content_hash, and removes the old files. Run once
+after enabling CONTENT_ADDRESSED_STORAGE; use --dry-run to see the
+savings first.
+"""
+import argparse
+import hashlib
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy.orm import Session
+from app.database import SessionLocal
+from app.models import Resource
+from app.services.file_service import content_path, release_file
+from app.services.storage import storage, storage_key
+
+
+def hash_file(key: str) -> str:
+    """SHA-256 hex digest of a stored file, read in chunks."""
+    digest = hashlib.sha256()
+    for chunk in storage.get_stream(key):
+        digest.update(chunk)
+    return digest.hexdigest()
+
+
+def dedupe_uploads(dry_run: bool) -> None:
+    """Rehome each resource file under its content hash."""
+    db: Session = SessionLocal()
+    moved = shared = missing = 0
+    bytes_saved = 0
+    seen = set()
+
+    try:
+        for resource in db.query(Resource).order_by(Resource.created_at).all():
+            old_key = storage_key(resource.file_url)
+            stored = storage.stat(old_key)
+            if stored is None:
+                print(f"✗ Missing file for {resource.title!r}: {resource.file_url}")
+                missing += 1
+                continue
+
+            content_hash = resource.content_hash or hash_file(old_key)
+            key = content_path(content_hash)
+            file_url = f"uploads/{key}"
+
+            if content_hash in seen:
+                shared += 1
+                if resource.file_url != file_url:
+                    bytes_saved += stored.size
+            seen.add(content_hash)
+
+            if resource.file_url == file_url and resource.content_hash:
+                continue
+
+            if dry_run:
+                moved += 1
+                continue
+
+            if storage.stat(key) is None:
+                # Copied, not moved: other resources may share the old file
+                storage.put(key, storage.get_stream(old_key), "application/pdf")
+
+            old_file_url = resource.file_url
+            resource.file_url = file_url
+            resource.content_hash = content_hash
+            db.commit()
+            if old_file_url != file_url:
+                release_file(db, old_file_url)
+            moved += 1
+
+        action = "Would move" if dry_run else "Moved"
+        print(f"✓ {action} {moved} file(s); {shared} duplicate(s), "
+              f"{bytes_saved / (1024 * 1024):.1f} MiB saved; {missing} missing")
+    finally:
+        db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dry-run", action="store_true", help="Report without changing anything")
+    args = parser.parse_args()
+    dedupe_uploads(args.dry_run)
+
+
+if __name__ == "__main__":
+    main()
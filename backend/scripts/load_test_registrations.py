@@ -0,0 +1,161 @@
+"""
+Registration Capacity Load Test
+Fires concurrent registrations at a capped event and checks it is never overbooked
+
+Every worker waits on a barrier and they are released together, so by
+default (one worker per request) all registrants hit the event at once.
+All requests come from one client IP, so run the server with a relaxed
+budget, e.g. ROUTE_RATE_LIMITS="POST /api/registrations=100000:1000".
+"""
+
+import argparse
+import os
+import sys
+import threading
+import uuid
+from collections import Counter
+from datetime import date, timedelta
+
+import requests
+from colorama import init, Fore
+
+# Initialize colorama for colored output
+init(autoreset=True)
+
+
+def print_header(text):
+    """Print a formatted header"""
+    print(f"\n{Fore.CYAN}{'='*60}")
+    print(f"{Fore.CYAN}{text:^60}")
+    print(f"{Fore.CYAN}{'='*60}\n")
+
+
+def print_success(text):
+    """Print success message"""
+    print(f"{Fore.GREEN}✓ {text}")
+
+
+def print_error(text):
+    """Print error message"""
+    print(f"{Fore.RED}✗ {text}")
+
+
+def print_info(text):
+    """Print info message"""
+    print(f"{Fore.YELLOW}ℹ {text}")
+
+
+def login(api_base):
+    """Log in as admin and return auth headers"""
+    response = requests.post(
+        f"{api_base}/auth/login",
+        json={
+            "username": os.getenv("ADMIN_USERNAME", "admin"),
+            "password": os.getenv("ADMIN_PASSWORD", "admin123")
+        },
+        timeout=10
+    )
+    response.raise_for_status()
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+def create_event(api_base, headers, capacity):
+    """Create a throwaway event with the given capacity"""
+    response = requests.post(
+        f"{api_base}/events",
+        headers=headers,
+        json={
+            "title": f"Load test {uuid.uuid4().hex[:8]}",
+            "type": "Workshop",
+            "date": (date.today() + timedelta(days=1)).isoformat(),
+            "capacity": capacity
+        },
+        timeout=10
+    )
+    response.raise_for_status()
+    return response.json()["id"]
+
+
+def register(api_base, event_id, index):
+    """Submit one registration and return (status code, registration status)"""
+    response = requests.post(
+        f"{api_base}/registrations",
+        json={
+            "event_id": event_id,
+            "operative_name": f"Load Tester {index}",
+            "moodle_id": f"LOAD{index:08d}"
+        },
+        timeout=30
+    )
+    if response.status_code == 201:
+        return response.status_code, response.json()["status"]
+    return response.status_code, None
+
+
+def register_all(api_base, event_id, count, workers):
+    """Submit `count` registrations from `workers` threads started together"""
+    results = [None] * count
+    barrier = threading.Barrier(workers)
+    
+    def worker(first):
+        barrier.wait()
+        for index in range(first, count, workers):
+            results[index] = register(api_base, event_id, index)
+    
+    threads = [threading.Thread(target=worker, args=(first,)) for first in range(workers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--url", default="http://localhost:8000", help="Backend base URL")
+    parser.add_argument("--capacity", type=int, default=50, help="Event capacity")
+    parser.add_argument("--requests", type=int, default=500, help="Registrations to submit")
+    parser.add_argument("--workers", type=int, help="Concurrent clients (default: one per request)")
+    args = parser.parse_args()
+    workers = min(args.workers or args.requests, args.requests)
+    api_base = f"{args.url}/api"
+    
+    print_header("Registration Capacity Load Test")
+    
+    headers = login(api_base)
+    event_id = create_event(api_base, headers, args.capacity)
+    print_info(f"Created event {event_id} with capacity {args.capacity}")
+    print_info(f"Submitting {args.requests} registrations with {workers} workers...")
+    
+    results = register_all(api_base, event_id, args.requests, workers)
+    
+    codes = Counter(code for code, _ in results)
+    statuses = Counter(status for _, status in results if status)
+    print_info(f"HTTP status codes: {dict(codes)}")
+    print_info(f"Registration statuses: {dict(statuses)}")
+    print_info(f"Confirmed: {statuses['confirmed']}, waitlisted: {statuses['waitlisted']}, conflicts: {codes[409]}")
+    
+    stats = requests.get(f"{api_base}/events/{event_id}/stats", timeout=10).json()
+    print_info(f"Event stats: {stats}")
+    
+    passed = True
+    if stats["registration_count"] > args.capacity:
+        print_error(f"Overbooked: {stats['registration_count']} confirmed for {args.capacity} seats")
+        passed = False
+    if stats["registration_count"] != statuses["confirmed"]:
+        print_error(f"Confirmed counter {stats['registration_count']} != {statuses['confirmed']} confirmed responses")
+        passed = False
+    if stats["waitlist_count"] != statuses["waitlisted"]:
+        print_error(f"Waitlist counter {stats['waitlist_count']} != {statuses['waitlisted']} waitlisted responses")
+        passed = False
+    if codes[201] != args.requests:
+        print_info(f"{args.requests - codes[201]} requests were not accepted (429 means ROUTE_RATE_LIMITS is too strict)")
+    
+    if passed:
+        print_success("No overbooking; counters match responses")
+        return 0
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,87 @@
+"""Shared fixtures: app settings for tests and a fresh database per test."""
+import os
+import sys
+import tempfile
+from datetime import date, timedelta
+from pathlib import Path
+
+# Add backend directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# Settings are read at import time, so configure them before importing app.
+# Tests run against TEST_DATABASE_URL (PostgreSQL) when set, otherwise a
+# throwaway SQLite file.
+_tmp_dir = tempfile.mkdtemp(prefix="cybersec-tests-")
+os.environ["DATABASE_URL"] = os.getenv("TEST_DATABASE_URL", f"sqlite:///{_tmp_dir}/test.db")
+os.environ["JWT_SECRET_KEY"] = "test-secret-key-that-is-at-least-32-characters"
+os.environ["DEBUG"] = "false"
+os.environ["DB_BACKEND"] = "sync"
+os.environ["RATE_LIMIT_ENABLED"] = "false"
+os.environ["REGISTRATION_BATCHING_ENABLED"] = "false"
+os.environ["RESPONSE_CACHE_ENABLED"] = "false"
+os.environ["UPLOAD_DIR"] = os.path.join(_tmp_dir, "uploads")
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.ext.compiler import compiles
+
+
+@compiles(UUID, "sqlite")
+def _compile_uuid_for_sqlite(type_, compiler, **kw):
+    """Store PostgreSQL UUID columns as hex strings on SQLite."""
+    return "CHAR(32)"
+
+
+from app.database import Base, engine, SessionLocal
+from app.main import app
+from app.models import Event, EventType
+
+
+@pytest.fixture
+def db():
+    """Session on freshly created tables, dropped after the test."""
+    Base.metadata.create_all(bind=engine)
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+        Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture
+def client(db):
+    """Test client for the app, sharing the test database."""
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def make_event(db):
+    """Factory for events committed to the test database (next week, unlimited by default)."""
+    def make(capacity=None, **fields) -> Event:
+        event_row = Event(**{
+            "title": "Web Security Workshop",
+            "type": EventType.WORKSHOP,
+            "date": date.today() + timedelta(days=7),
+            "description": "OWASP Top 10",
+            "capacity": capacity,
+            **fields
+        })
+        db.add(event_row)
+        db.commit()
+        return event_row
+    return make
+
+
+@pytest.fixture
+def register(client):
+    """POST /api/registrations for an event; returns the response."""
+    def post(event_id, moodle_id="ABCDEFGH1", operative_name="Alice"):
+        return client.post("/api/registrations", json={
+            "event_id": str(event_id),
+            "operative_name": operative_name,
+            "moodle_id": moodle_id,
+        })
+    return post
@@ -0,0 +1,30 @@
+"""The user cache drops a changed user only once the change is committed."""
+from app.models import User
+from app.security import hash_password
+from app.services.auth_cache import get_active_user
+
+
+def test_deactivation_invalidates_after_commit(db):
+    db.add(User(username="cache-admin", password_hash=hash_password("s3cret-pass")))
+    db.commit()
+    assert get_active_user(db, "cache-admin") is not None
+
+    user = db.query(User).filter(User.username == "cache-admin").one()
+    user.is_active = False
+    db.flush()
+    # Flushed but uncommitted: other requests still see the committed row
+    assert get_active_user(db, "cache-admin").is_active
+
+    db.commit()
+    assert get_active_user(db, "cache-admin") is None
+
+
+def test_rename_invalidates_old_username(db):
+    db.add(User(username="old-name", password_hash=hash_password("s3cret-pass")))
+    db.commit()
+    assert get_active_user(db, "old-name") is not None
+
+    user = db.query(User).filter(User.username == "old-name").one()
+    user.username = "new-name"
+    db.commit()
+    assert get_active_user(db, "old-name") is None
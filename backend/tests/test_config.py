@@ -0,0 +1,26 @@
+"""Parsing of ROUTE_RATE_LIMITS."""
+import pytest
+
+from app.config import Settings
+
+
+def make_settings(route_rate_limits: str) -> Settings:
+    return Settings(
+        database_url="sqlite://",
+        jwt_secret_key="test-secret-key-that-is-at-least-32-characters",
+        route_rate_limits=route_rate_limits
+    )
+
+
+def test_route_rate_limits_map():
+    budgets = make_settings("POST /api/registrations/=30:10, get /api/events=120").route_rate_limits_map
+    assert budgets == {
+        ("POST", "/api/registrations"): (0.5, 10),
+        ("GET", "/api/events"): (2.0, 120),
+    }
+
+
+@pytest.mark.parametrize("entry", ["POST /api/registrations=0:5", "POST /api/registrations=-6", "POST /api/registrations=30:0"])
+def test_non_positive_budgets_are_rejected(entry):
+    with pytest.raises(ValueError, match="must be positive"):
+        make_settings(entry).route_rate_limits_map
@@ -0,0 +1,50 @@
+"""Event validators stay correct as registrations come in.
+
+Registrations update the event counters without touching updated_at, so
+the ETags of the event endpoints must cover the counts.
+"""
+from app.models import Event
+
+
+def test_registration_keeps_updated_at(db, make_event, register):
+    event_row = make_event(capacity=10)
+    updated_at = event_row.updated_at
+
+    assert register(event_row.id).status_code == 201
+
+    db.expire_all()
+    event_row = db.get(Event, event_row.id)
+    assert event_row.registration_count == 1
+    assert event_row.updated_at == updated_at
+
+
+def test_registration_changes_event_etag(client, make_event, register):
+    event_id = make_event(capacity=10).id
+    before = client.get(f"/api/events/{event_id}")
+    assert before.json()["registration_count"] == 0
+
+    assert register(event_id).status_code == 201
+
+    after = client.get(f"/api/events/{event_id}", headers={
+        "If-None-Match": before.headers["etag"],
+        "If-Modified-Since": before.headers["last-modified"],
+    })
+    assert after.status_code == 200
+    assert after.json()["registration_count"] == 1
+    assert after.headers["last-modified"] == before.headers["last-modified"]
+
+
+def test_registration_changes_listing_etag(client, make_event, register):
+    make_event(capacity=10)
+    before = client.get("/api/events")
+    event_id = before.json()[0]["id"]
+
+    assert register(event_id).status_code == 201
+
+    after = client.get("/api/events", headers={"If-None-Match": before.headers["etag"]})
+    assert after.status_code == 200
+    assert after.json()[0]["registration_count"] == 1
+
+    # Last-Modified alone cannot see the new count, so it is not used
+    unchanged = client.get("/api/events", headers={"If-Modified-Since": after.headers["last-modified"]})
+    assert unchanged.status_code == 200
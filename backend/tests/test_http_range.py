@@ -0,0 +1,37 @@
+"""Range header parsing: malformed headers send the full file, 416 only for unsatisfiable ones."""
+import pytest
+
+from app.utils.http_range import RangeNotSatisfiable, parse_range_header
+
+
+@pytest.mark.parametrize("header, expected", [
+    ("bytes=0-9", [(0, 9)]),
+    ("bytes=90-", [(90, 99)]),
+    ("bytes=-10", [(90, 99)]),
+    ("bytes=50-500", [(50, 99)]),
+    ("bytes=0-4, 10-14, 3-6", [(0, 6), (10, 14)]),
+])
+def test_valid_ranges(header, expected):
+    assert parse_range_header(header, 100) == expected
+
+
+@pytest.mark.parametrize("header", [
+    None,
+    "items=0-9",
+    "bytes=",
+    "bytes=-",
+    "bytes=--5",
+    "bytes=5-3",
+    "bytes=+5-10",
+    "bytes=5_0-",
+    "bytes=1-2-3",
+    "bytes=0-1,",
+])
+def test_malformed_ranges_are_ignored(header):
+    assert parse_range_header(header, 100) is None
+
+
+@pytest.mark.parametrize("header", ["bytes=100-", "bytes=200-300", "bytes=-0"])
+def test_unsatisfiable_ranges(header):
+    with pytest.raises(RangeNotSatisfiable):
+        parse_range_header(header, 100)
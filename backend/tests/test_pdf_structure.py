@@ -0,0 +1,32 @@
+"""PDF upload structure check: trailer and cross-reference required, viewer-repairable files accepted."""
+import io
+
+import pytest
+
+from app.services.file_service import validate_pdf_structure
+
+HEAD = b"%PDF-1.4\n1 0 obj<<>>endobj\n"
+
+
+def classic_pdf(offset=len(HEAD)) -> bytes:
+    return HEAD + b"xref\n0 1\n0000000000 65535 f \ntrailer<<>>\nstartxref\n" + str(offset).encode() + b"\n%%EOF\n"
+
+
+@pytest.mark.parametrize("content", [
+    classic_pdf(),
+    HEAD + b"5 0 obj<</Type /XRef /Size 6>>stream\nxx\nendstream endobj\nstartxref\n27\n%%EOF",
+    # Repaired by viewers: a stale startxref offset, junk after %%EOF
+    classic_pdf(offset=3),
+    classic_pdf() + b"\0" * 5000,
+])
+def test_accepted(content):
+    assert validate_pdf_structure(io.BytesIO(content))
+
+
+@pytest.mark.parametrize("content", [
+    HEAD,
+    classic_pdf()[:-30],
+    HEAD + b"startxref\n27\n%%EOF\n",
+])
+def test_rejected(content):
+    assert not validate_pdf_structure(io.BytesIO(content))
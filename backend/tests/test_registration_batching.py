@@ -0,0 +1,27 @@
+"""Batched registrations answer with the event's counter after the insert."""
+import pytest
+
+from app.config import settings
+
+
+@pytest.fixture
+def batching(monkeypatch):
+    monkeypatch.setattr(settings, "registration_batching_enabled", True)
+
+
+def test_batched_response_counts_the_new_registration(batching, make_event, register):
+    event_id = make_event(capacity=2).id
+
+    counts = []
+    for moodle_id in ["ABCDEFGH1", "ABCDEFGH2", "ABCDEFGH3"]:
+        response = register(event_id, moodle_id)
+        assert response.status_code == 201
+        counts.append((response.json()["status"], response.json()["event"]["registration_count"]))
+
+    assert counts == [("confirmed", 1), ("confirmed", 2), ("waitlisted", 2)]
+
+
+def test_batched_duplicate_is_rejected(batching, make_event, register):
+    event_id = make_event().id
+    assert register(event_id, "ABCDEFGH1").status_code == 201
+    assert register(event_id, "ABCDEFGH1").status_code == 409
@@ -0,0 +1,82 @@
+"""Statement counts for POST /api/registrations.
+
+The registration hot path is one atomic seat claim plus one
+INSERT ... ON CONFLICT DO NOTHING RETURNING; these tests keep it from
+quietly growing extra queries (existence checks, refreshes, lazy loads).
+"""
+from contextlib import contextmanager
+from typing import Iterator, List
+
+import pytest
+from sqlalchemy import event
+
+from app.database import engine
+from app.models import Event, Registration, RegistrationStatus
+
+
+@contextmanager
+def count_statements() -> Iterator[List[str]]:
+    """Collect the SQL statements executed on the engine."""
+    statements: List[str] = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+@pytest.mark.parametrize("capacity", [None, 10])
+def test_registration_uses_claim_and_insert(make_event, register, capacity):
+    event_id = make_event(capacity=capacity).id
+
+    with count_statements() as statements:
+        response = register(event_id)
+
+    assert response.status_code == 201
+    assert response.json()["status"] == "confirmed"
+    assert len(statements) == 2, statements
+    assert statements[0].lstrip().upper().startswith("UPDATE EVENTS")
+    assert statements[1].lstrip().upper().startswith("INSERT INTO REGISTRATIONS")
+
+
+def test_full_event_adds_waitlist_claim(make_event, register):
+    event_id = make_event(capacity=1).id
+    assert register(event_id, moodle_id="ABCDEFGH0").status_code == 201
+
+    with count_statements() as statements:
+        response = register(event_id)
+
+    assert response.status_code == 201
+    assert response.json()["status"] == "waitlisted"
+    # Seat claim (no row), waitlist claim, insert
+    assert len(statements) == 3, statements
+
+
+def test_duplicate_is_rejected_without_extra_queries(db, make_event, register):
+    event_id = make_event().id
+    assert register(event_id).status_code == 201
+
+    with count_statements() as statements:
+        response = register(event_id)
+
+    assert response.status_code == 409
+    # Seat claim, insert that returns no row; the rollback releases the seat
+    assert len(statements) == 2, statements
+
+    db.expire_all()
+    assert db.get(Event, event_id).registration_count == 1
+    assert db.query(Registration).filter(Registration.status == RegistrationStatus.CONFIRMED).count() == 1
+
+
+def test_unknown_event_is_404_after_both_claims(make_event, register):
+    make_event()
+
+    with count_statements() as statements:
+        response = register("00000000-0000-0000-0000-000000000000")
+
+    assert response.status_code == 404
+    assert len(statements) == 2, statements
@@ -0,0 +1,36 @@
+"""The resource listing revalidates by ETag, so deletions are never hidden by a 304."""
+from datetime import datetime, timedelta
+
+from app.models import Resource, ResourceLevel
+
+
+def make_resource(db, title, updated_at) -> Resource:
+    resource = Resource(
+        title=title,
+        level=ResourceLevel.BEGINNER,
+        file_url=f"uploads/{title}.pdf",
+        created_at=updated_at,
+        updated_at=updated_at
+    )
+    db.add(resource)
+    db.commit()
+    return resource
+
+
+def test_deleting_older_resource_changes_listing(client, db):
+    now = datetime.utcnow().replace(microsecond=0)
+    older = make_resource(db, "intro", now - timedelta(days=1))
+    make_resource(db, "advanced", now)
+    before = client.get("/api/resources")
+    assert len(before.json()) == 2
+
+    # A hard delete of the older row leaves max(updated_at) unchanged
+    db.delete(older)
+    db.commit()
+
+    after = client.get("/api/resources", headers={"If-Modified-Since": before.headers["last-modified"]})
+    assert after.status_code == 200
+    assert len(after.json()) == 1
+
+    stale = client.get("/api/resources", headers={"If-None-Match": before.headers["etag"]})
+    assert stale.status_code == 200
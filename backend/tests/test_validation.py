@@ -0,0 +1,62 @@
+"""sanitize_string/sanitize_text must match plain bleach.clean on every input.
+
+The sanitizers skip the HTML parse for input without markup-significant
+characters; these cases keep that shortcut from changing the output.
+"""
+import random
+
+import bleach
+import pytest
+
+from app.utils.validation import sanitize_string, sanitize_text, ALLOWED_TEXT_TAGS
+
+CORPUS = [
+    "", " ", "   padded   ", "Ada Lovelace", "O'Brien", 'Say "hi"', "Team #1 (alpha) / beta",
+    "Ünïcödé – naïve café ☕ 漢字 🚀", "tab\tand\nnewline", "carriage\r\nreturn", "form\x0cfeed",
+    "vertical\x0btab", "nul\x00byte", "bell\x07", "del\x7fchar", "c1\x85next", "zero​width",
+    "<script>alert(1)</script>", "<b>bold</b> text", "<p>para</p><br>", "<img src=x onerror=alert(1)>",
+    "a < b", "a > b", "a <b", "1 & 2", "&amp;", "&lt;script&gt;", "&#60;script&#62;", "&#x3C;",
+    "&notanentity;", "&", "<", ">", "<<>>", "<!-- comment -->", "<![CDATA[x]]>", "<?xml?>",
+    "<a href=\"javascript:alert(1)\">x</a>", "<svg/onload=alert(1)>", "<strong>ok</strong><em>x</em>",
+    "<ul><li>one</li><li>two</li></ul>", "<u>under</u>", "<div>div</div>", "text</p>", "<p>unclosed",
+    "﻿bom", "￾￿", "surrogate-free \U0001F600",
+]
+
+ALPHABET = (
+    "abcXYZ 019'\"/\\-_.,;:!?()[]{}#%*+=~`|@$^"
+    "\t\n\r\x00\x01\x0b\x0c\x1f\x7f\x85\xa0​﻿"
+    "<>&;/=#xX" "pbrstrongemuli" "éü漢🚀"
+)
+
+_rng = random.Random(0)
+RANDOM_INPUTS = ["".join(_rng.choice(ALPHABET) for _ in range(_rng.randint(0, 40))) for _ in range(2000)]
+
+
+def reference_string(value, max_length=None):
+    cleaned = bleach.clean(value, tags=[], attributes={}, strip=True).strip()
+    if max_length and len(cleaned) > max_length:
+        cleaned = cleaned[:max_length]
+    return cleaned
+
+
+def reference_text(value):
+    return bleach.clean(value, tags=ALLOWED_TEXT_TAGS, attributes={}, strip=True).strip()
+
+
+@pytest.mark.parametrize("value", CORPUS)
+def test_sanitize_string_matches_bleach(value):
+    assert sanitize_string(value, max_length=20) == reference_string(value, 20)
+
+
+@pytest.mark.parametrize("value", CORPUS)
+def test_sanitize_text_matches_bleach(value):
+    assert sanitize_text(value) == reference_text(value)
+
+
+def test_random_inputs_match_bleach():
+    mismatches = [
+        value for value in RANDOM_INPUTS
+        if sanitize_string(value, max_length=20) != reference_string(value, 20)
+        or sanitize_text(value) != reference_text(value)
+    ]
+    assert mismatches == []